@@ -0,0 +1,38 @@
+"""Shared API routing utilities"""
+
+from typing import Any, Callable, Coroutine, Dict, Union
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+INTERNAL_ERROR_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    500: {"description": "Unexpected server error"}
+}
+
+
+class ErrorHandlingRoute(APIRoute):
+    """Route that turns unexpected endpoint errors into 500 responses.
+
+    The error detail is derived from the endpoint name, e.g. an unexpected
+    error in ``get_daily_analytics`` becomes "Failed to get daily analytics:
+    <error>". HTTP and request validation errors pass through unchanged.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        action = self.endpoint.__name__.replace("_", " ")
+
+        async def handle(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                return ORJSONResponse(
+                    status_code=500, content={"detail": f"Failed to {action}: {e}"}
+                )
+
+        return handle
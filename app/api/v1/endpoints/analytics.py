@@ -1,10 +1,15 @@
 """Analytics API endpoints for order metrics and reporting"""
 
+import hashlib
 from datetime import date, timedelta
-from typing import Optional
+from typing import Annotated, AsyncIterator, Callable, Optional, Type, TypeVar, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
+from app.api.routing import INTERNAL_ERROR_RESPONSES, ErrorHandlingRoute
+from app.core.config import get_settings
 from app.models.analytics import CustomerMetrics
 from app.schemas.analytics import (
     AnalyticsDateRange,
@@ -16,7 +21,130 @@ from app.schemas.analytics import (
 )
 from app.services.analytics_service import AnalyticsService, get_analytics_service
 
-router = APIRouter(prefix="/analytics", tags=["analytics"])
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+    route_class=ErrorHandlingRoute,
+    responses=INTERNAL_ERROR_RESPONSES,
+)
+
+settings = get_settings()
+
+# Orders in a closed range can still be updated or cancelled, so clients
+# revalidate closed-range responses against their ETag once this expires
+_HISTORICAL_CACHE_CONTROL = f"public, max-age={settings.analytics_cache_ttl}"
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+# Default window: 30 days including the end date
+_DEFAULT_WINDOW = timedelta(days=29)
+
+
+def _thirty_days_before(end_date: date) -> date:
+    """Default start: 30 days including the end date"""
+    return end_date - _DEFAULT_WINDOW
+
+
+def _month_start(end_date: date) -> date:
+    """Default start: first day of the end date's month"""
+    return end_date.replace(day=1)
+
+
+def _one_year_before(end_date: date) -> date:
+    """Default start: same day one year earlier"""
+    return end_date.replace(year=end_date.year - 1)
+
+
+def _resolve_range(
+    start_date: Optional[date],
+    end_date: Optional[date],
+    default_start: Callable[[date], date] = _thirty_days_before,
+) -> AnalyticsDateRange:
+    """Apply default dates and validate the requested analytics range"""
+    today = date.today()
+    if not end_date:
+        end_date = today
+    if not start_date:
+        start_date = default_start(end_date)
+
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start date must be before or equal to end date",
+        )
+
+    if end_date > today:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="End date cannot be in the future",
+        )
+
+    # Both dates are checked above, so skip re-running the model validators
+    return AnalyticsDateRange.model_construct(start_date=start_date, end_date=end_date)
+
+
+class DateRangeParams:
+    """Analytics date range query parameters, defaulting to the last 30 days"""
+
+    def __init__(
+        self,
+        start_date: Optional[date] = Query(
+            None, description="Start date (YYYY-MM-DD). Defaults to 30 days ago"
+        ),
+        end_date: Optional[date] = Query(
+            None, description="End date (YYYY-MM-DD). Defaults to today"
+        ),
+    ):
+        self.range = _resolve_range(start_date, end_date)
+
+
+class MonthToDateParams:
+    """Analytics date range query parameters, defaulting to the current month"""
+
+    def __init__(
+        self,
+        start_date: Optional[date] = Query(
+            None, description="Start date (YYYY-MM-DD). Defaults to current month start"
+        ),
+        end_date: Optional[date] = Query(
+            None, description="End date (YYYY-MM-DD). Defaults to today"
+        ),
+    ):
+        self.range = _resolve_range(start_date, end_date, _month_start)
+
+
+def _cache_historical(
+    request: Request,
+    date_range: Optional[AnalyticsDateRange],
+    response_model: Type[ResponseT],
+    result: ResponseT,
+) -> Union[ResponseT, Response]:
+    """Serve closed-range results with an ETag over the response body
+
+    Results for ranges that include today are returned as-is. Closed ranges
+    are serialized here so the ETag hashes the exact bytes sent, and a
+    matching If-None-Match is answered with 304.
+    """
+    if date_range is None or date_range.end_date >= date.today():
+        return result
+
+    body = response_model.model_validate(result, from_attributes=True)
+    content = body.model_dump_json().encode()
+    etag = f'W/"{hashlib.sha1(content).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": _HISTORICAL_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+async def _ndjson_lines(metrics: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    """Serialize streamed models as newline-delimited JSON"""
+    async for metric in metrics:
+        yield metric.model_dump_json() + "\n"
 
 
 @router.get(
@@ -26,45 +154,13 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
     description="Retrieve daily order metrics including revenue, order count, and average order value for a specified date range",
 )
 async def get_daily_analytics(
-    start_date: Optional[date] = Query(
-        None, description="Start date (YYYY-MM-DD). Defaults to 30 days ago"
-    ),
-    end_date: Optional[date] = Query(
-        None, description="End date (YYYY-MM-DD). Defaults to today"
-    ),
+    params: Annotated[DateRangeParams, Depends()],
+    request: Request,
     analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> DailyAnalyticsResponse:
+) -> Union[DailyAnalyticsResponse, Response]:
     """Get daily analytics metrics"""
-    try:
-        # Set default date range if not provided
-        if not end_date:
-            end_date = date.today()
-        if not start_date:
-            start_date = end_date - timedelta(days=29)  # 30 days total
-
-        # Validate date range
-        if start_date > end_date:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Start date must be before or equal to end date",
-            )
-
-        if end_date > date.today():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="End date cannot be in the future",
-            )
-
-        date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
-        return await analytics_service.get_daily_analytics(date_range)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get daily analytics: {str(e)}",
-        )
+    result = await analytics_service.get_daily_analytics(params.range)
+    return _cache_historical(request, params.range, DailyAnalyticsResponse, result)
 
 
 @router.get(
@@ -74,39 +170,15 @@ async def get_daily_analytics(
     description="Retrieve order metrics grouped by order status (pending, confirmed, shipped, etc.)",
 )
 async def get_order_status_analytics(
-    start_date: Optional[date] = Query(
-        None, description="Start date (YYYY-MM-DD). Defaults to 30 days ago"
-    ),
-    end_date: Optional[date] = Query(
-        None, description="End date (YYYY-MM-DD). Defaults to today"
-    ),
+    params: Annotated[DateRangeParams, Depends()],
+    request: Request,
     analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> OrderStatusAnalyticsResponse:
+) -> Union[OrderStatusAnalyticsResponse, Response]:
     """Get order analytics grouped by status"""
-    try:
-        # Set default date range if not provided
-        if not end_date:
-            end_date = date.today()
-        if not start_date:
-            start_date = end_date - timedelta(days=29)
-
-        # Validate date range
-        if start_date > end_date:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Start date must be before or equal to end date",
-            )
-
-        date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
-        return await analytics_service.get_order_status_analytics(date_range)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get order status analytics: {str(e)}",
-        )
+    result = await analytics_service.get_order_status_analytics(params.range)
+    return _cache_historical(
+        request, params.range, OrderStatusAnalyticsResponse, result
+    )
 
 
 @router.get(
@@ -116,42 +188,16 @@ async def get_order_status_analytics(
     description="Retrieve top customers ranked by total spending amount",
 )
 async def get_top_customers_analytics(
-    start_date: Optional[date] = Query(
-        None, description="Start date (YYYY-MM-DD). Defaults to 30 days ago"
-    ),
-    end_date: Optional[date] = Query(
-        None, description="End date (YYYY-MM-DD). Defaults to today"
-    ),
+    params: Annotated[DateRangeParams, Depends()],
+    request: Request,
     limit: int = Query(
         default=10, ge=1, le=100, description="Maximum number of customers to return"
     ),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> TopCustomersResponse:
+) -> Union[TopCustomersResponse, Response]:
     """Get top customers by spending"""
-    try:
-        # Set default date range if not provided
-        if not end_date:
-            end_date = date.today()
-        if not start_date:
-            start_date = end_date - timedelta(days=29)
-
-        # Validate date range
-        if start_date > end_date:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Start date must be before or equal to end date",
-            )
-
-        date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
-        return await analytics_service.get_top_customers(date_range, limit)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get top customers analytics: {str(e)}",
-        )
+    result = await analytics_service.get_top_customers(params.range, limit)
+    return _cache_historical(request, params.range, TopCustomersResponse, result)
 
 
 @router.get(
@@ -161,40 +207,13 @@ async def get_top_customers_analytics(
     description="Retrieve a comprehensive analytics dashboard with revenue, trends, top customers, and key insights",
 )
 async def get_analytics_summary(
-    start_date: Optional[date] = Query(
-        None, description="Start date (YYYY-MM-DD). Defaults to current month start"
-    ),
-    end_date: Optional[date] = Query(
-        None, description="End date (YYYY-MM-DD). Defaults to today"
-    ),
+    params: Annotated[MonthToDateParams, Depends()],
+    request: Request,
     analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> AnalyticsSummaryResponse:
+) -> Union[AnalyticsSummaryResponse, Response]:
     """Get comprehensive analytics summary"""
-    try:
-        # Set default date range if not provided
-        if not end_date:
-            end_date = date.today()
-        if not start_date:
-            # Default to current month
-            start_date = end_date.replace(day=1)
-
-        # Validate date range
-        if start_date > end_date:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Start date must be before or equal to end date",
-            )
-
-        date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
-        return await analytics_service.get_analytics_summary(date_range)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get analytics summary: {str(e)}",
-        )
+    result = await analytics_service.get_analytics_summary(params.range)
+    return _cache_historical(request, params.range, AnalyticsSummaryResponse, result)
 
 
 @router.get(
@@ -207,18 +226,21 @@ async def get_revenue_trends(
     days: int = Query(
         default=30, ge=1, le=365, description="Number of days to analyze"
     ),
+    stream: bool = Query(
+        default=False,
+        description="Stream daily metrics as newline-delimited JSON as they load",
+    ),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> DailyAnalyticsResponse:
+) -> Union[DailyAnalyticsResponse, StreamingResponse]:
     """Get revenue trends for the last N days"""
-    try:
-        return await analytics_service.get_revenue_trends(days)
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get revenue trends: {str(e)}",
+    if stream:
+        return StreamingResponse(
+            _ndjson_lines(analytics_service.stream_revenue_trends(days)),
+            media_type="application/x-ndjson",
         )
 
+    return await analytics_service.get_revenue_trends(days)
+
 
 @router.get(
     "/customers/{customer_id}",
@@ -228,6 +250,7 @@ async def get_revenue_trends(
 )
 async def get_customer_analytics(
     customer_id: str,
+    request: Request,
     start_date: Optional[date] = Query(
         None, description="Start date (YYYY-MM-DD). Defaults to 1 year ago"
     ),
@@ -235,35 +258,14 @@ async def get_customer_analytics(
         None, description="End date (YYYY-MM-DD). Defaults to today"
     ),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> CustomerMetrics:
+) -> Union[CustomerMetrics, Response]:
     """Get analytics for a specific customer"""
-    try:
-        date_range = None
-        if start_date or end_date:
-            # Set default date range if not provided
-            if not end_date:
-                end_date = date.today()
-            if not start_date:
-                start_date = end_date.replace(year=end_date.year - 1)  # 1 year ago
-
-            # Validate date range
-            if start_date > end_date:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Start date must be before or equal to end date",
-                )
-
-            date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
-
-        return await analytics_service.get_customer_analytics(customer_id, date_range)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get customer analytics: {str(e)}",
-        )
+    date_range = None
+    if start_date or end_date:
+        date_range = _resolve_range(start_date, end_date, _one_year_before)
+
+    result = await analytics_service.get_customer_analytics(customer_id, date_range)
+    return _cache_historical(request, date_range, CustomerMetrics, result)
 
 
 # Additional convenience endpoints
@@ -280,7 +282,7 @@ async def get_today_analytics(
 ) -> DailyAnalyticsResponse:
     """Get analytics for today"""
     today = date.today()
-    date_range = AnalyticsDateRange(start_date=today, end_date=today)
+    date_range = AnalyticsDateRange.model_construct(start_date=today, end_date=today)
     return await analytics_service.get_daily_analytics(date_range)
 
 
@@ -309,5 +311,7 @@ async def get_month_analytics_summary(
     """Get analytics summary for current month"""
     today = date.today()
     start_of_month = today.replace(day=1)
-    date_range = AnalyticsDateRange(start_date=start_of_month, end_date=today)
+    date_range = AnalyticsDateRange.model_construct(
+        start_date=start_of_month, end_date=today
+    )
     return await analytics_service.get_analytics_summary(date_range)
@@ -1,6 +1,7 @@
 """Health check endpoints"""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.core.config import get_settings
 
@@ -8,6 +9,32 @@ router = APIRouter(prefix="/health", tags=["health"])
 
 settings = get_settings()
 
+# Probe payloads never change for the life of the process, so they are
+# serialized once at import and served as raw bytes.
+_HEALTHY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": settings.app_name,
+        "version": settings.app_version,
+    }
+)
+_READY = orjson.dumps(
+    {
+        "status": "ready",
+        "service": settings.app_name,
+        "version": settings.app_version,
+        "database": "connected",
+        "timestamp": "2026-01-21T10:00:00Z",
+    }
+)
+_ALIVE = orjson.dumps(
+    {
+        "status": "alive",
+        "service": settings.app_name,
+        "version": settings.app_version,
+    }
+)
+
 
 @router.get(
     "/",
@@ -16,11 +43,7 @@ settings = get_settings()
 )
 async def health_check():
     """Basic health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": settings.app_version,
-    }
+    return Response(content=_HEALTHY, media_type="application/json")
 
 
 @router.get(
@@ -33,13 +56,7 @@ async def readiness_check():
     try:
         # In a real application, you would test database connectivity here
         # For now, we'll just return ready status
-        return {
-            "status": "ready",
-            "service": settings.app_name,
-            "version": settings.app_version,
-            "database": "connected",
-            "timestamp": "2026-01-21T10:00:00Z",
-        }
+        return Response(content=_READY, media_type="application/json")
     except Exception as e:
         return {
             "status": "not_ready",
@@ -54,11 +71,8 @@ async def readiness_check():
     "/live",
     summary="Liveness check",
     description="Returns liveness status of the service",
+    include_in_schema=False,
 )
 async def liveness_check():
     """Liveness check endpoint"""
-    return {
-        "status": "alive",
-        "service": settings.app_name,
-        "version": settings.app_version,
-    }
+    return Response(content=_ALIVE, media_type="application/json")
@@ -1,20 +1,63 @@
 """Order API endpoints"""
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
+from app.api.routing import INTERNAL_ERROR_RESPONSES, ErrorHandlingRoute
 from app.models.base import OrderStatus
 from app.schemas.order import (
     MessageResponse,
     OrderCreate,
+    OrderListItemResponse,
     OrderListResponse,
     OrderResponse,
     OrderUpdate,
 )
 from app.services.order_service import OrderService, get_order_service
 
-router = APIRouter(prefix="/orders", tags=["orders"])
+router = APIRouter(
+    prefix="/orders",
+    tags=["orders"],
+    route_class=ErrorHandlingRoute,
+    responses=INTERNAL_ERROR_RESPONSES,
+)
+
+# Orders coming back from the service are already validated, so responses are
+# built without a second validation pass. FastAPI still checks single-order
+# output against the route's response_model, through a TypeAdapter it builds
+# once per route; listings are serialized directly (see _list_json_response).
+_to_response = OrderResponse.model_construct
+_to_list_item = OrderListItemResponse.model_construct
+
+
+def _list_json_response(listing: OrderListResponse) -> Response:
+    """Serialize an order listing straight to JSON bytes
+
+    Listings are the largest responses, so they skip FastAPI's
+    dump/validate/encode round trip; pydantic-core writes the bytes directly.
+    """
+    return Response(content=listing.model_dump_json(), media_type="application/json")
+
+
+class Pagination:
+    """Page-based pagination query parameters"""
+
+    def __init__(
+        self,
+        page: int = Query(1, ge=1, description="Page number"),
+        page_size: int = Query(
+            20, ge=1, le=100, description="Number of items per page"
+        ),
+        continuation_token: Optional[str] = Query(
+            None,
+            description="Token from the previous page of a customer's orders; "
+            "cheaper than a page number for deep pages",
+        ),
+    ):
+        self.page = page
+        self.page_size = page_size
+        self.continuation_token = continuation_token
 
 
 @router.post(
@@ -30,7 +73,7 @@ async def create_order(
     """Create a new order"""
     try:
         order = await order_service.create_order(order_data)
-        return OrderResponse(**order.dict())
+        return _to_response(**order.__dict__)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,34 +88,31 @@ async def create_order(
     description="Get a paginated list of orders, optionally filtered by customer or status",
 )
 async def list_orders(
+    pagination: Annotated[Pagination, Depends()],
     customer_id: Optional[str] = Query(None, description="Filter by customer ID"),
     order_status: Optional[OrderStatus] = Query(
         None, alias="status", description="Filter by order status"
     ),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
     order_service: OrderService = Depends(get_order_service),
-) -> OrderListResponse:
+) -> Response:
     """List orders with pagination and optional filters"""
-    try:
-        orders, total_count = await order_service.list_orders(
-            customer_id=customer_id, status=order_status, page=page, page_size=page_size
-        )
-
-        total_pages = (total_count + page_size - 1) // page_size
+    orders, total_count, continuation_token = await order_service.list_orders(
+        customer_id=customer_id,
+        status=order_status,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        continuation_token=pagination.continuation_token,
+    )
 
-        return OrderListResponse(
-            orders=[OrderResponse(**order.dict()) for order in orders],
+    return _list_json_response(
+        OrderListResponse.paginate(
+            orders=[_to_list_item(**order.__dict__) for order in orders],
             total_count=total_count,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list orders: {str(e)}",
+            page=pagination.page,
+            page_size=pagination.page_size,
+            continuation_token=continuation_token,
         )
+    )
 
 
 @router.get(
@@ -87,21 +127,13 @@ async def get_order(
     order_service: OrderService = Depends(get_order_service),
 ) -> OrderResponse:
     """Get a specific order by ID"""
-    try:
-        order = await order_service.get_order(order_id, customer_id)
-        if not order:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Order {order_id} not found",
-            )
-        return OrderResponse(**order.dict())
-    except HTTPException:
-        raise
-    except Exception as e:
+    order = await order_service.get_order(order_id, customer_id)
+    if not order:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get order: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order {order_id} not found",
         )
+    return _to_response(**order.__dict__)
 
 
 @router.get(
@@ -114,21 +146,13 @@ async def get_order_by_number(
     order_number: str, order_service: OrderService = Depends(get_order_service)
 ) -> OrderResponse:
     """Get a specific order by order number"""
-    try:
-        order = await order_service.get_order_by_number(order_number)
-        if not order:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Order {order_number} not found",
-            )
-        return OrderResponse(**order.dict())
-    except HTTPException:
-        raise
-    except Exception as e:
+    order = await order_service.get_order_by_number(order_number)
+    if not order:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get order: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order {order_number} not found",
         )
+    return _to_response(**order.__dict__)
 
 
 @router.put(
@@ -151,16 +175,9 @@ async def update_order(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Order {order_id} not found",
             )
-        return OrderResponse(**order.dict())
-    except HTTPException:
-        raise
+        return _to_response(**order.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update order: {str(e)}",
-        )
 
 
 @router.post(
@@ -186,15 +203,8 @@ async def cancel_order(
             message=f"Order {order.order_number} cancelled successfully",
             order_id=order.id,
         )
-    except HTTPException:
-        raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to cancel order: {str(e)}",
-        )
 
 
 @router.delete(
@@ -209,23 +219,15 @@ async def delete_order(
     order_service: OrderService = Depends(get_order_service),
 ) -> MessageResponse:
     """Delete an order (admin operation)"""
-    try:
-        deleted = await order_service.delete_order(order_id, customer_id)
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Order {order_id} not found",
-            )
-        return MessageResponse(
-            message=f"Order {order_id} deleted successfully", order_id=order_id
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    deleted = await order_service.delete_order(order_id, customer_id)
+    if not deleted:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete order: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order {order_id} not found",
         )
+    return MessageResponse(
+        message=f"Order {order_id} deleted successfully", order_id=order_id
+    )
 
 
 @router.get(
@@ -236,27 +238,23 @@ async def delete_order(
 )
 async def get_customer_orders(
     customer_id: str,
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    pagination: Annotated[Pagination, Depends()],
     order_service: OrderService = Depends(get_order_service),
-) -> OrderListResponse:
+) -> Response:
     """Get all orders for a specific customer"""
-    try:
-        orders, total_count = await order_service.get_customer_orders(
-            customer_id=customer_id, page=page, page_size=page_size
-        )
-
-        total_pages = (total_count + page_size - 1) // page_size
+    orders, total_count, continuation_token = await order_service.get_customer_orders(
+        customer_id=customer_id,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        continuation_token=pagination.continuation_token,
+    )
 
-        return OrderListResponse(
-            orders=[OrderResponse(**order.dict()) for order in orders],
+    return _list_json_response(
+        OrderListResponse.paginate(
+            orders=[_to_list_item(**order.__dict__) for order in orders],
             total_count=total_count,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get customer orders: {str(e)}",
+            page=pagination.page,
+            page_size=pagination.page_size,
+            continuation_token=continuation_token,
         )
+    )
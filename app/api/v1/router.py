@@ -7,6 +7,5 @@ from app.api.v1.endpoints import analytics, health, orders
 api_router = APIRouter()
 
 # Include endpoint routers
-api_router.include_router(orders.router)
-api_router.include_router(health.router)
-api_router.include_router(analytics.router)
+for endpoint_router in (orders.router, health.router, analytics.router):
+    api_router.include_router(endpoint_router)
@@ -3,12 +3,17 @@
 from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseSettings
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True
+    )
+
     # Application settings
     app_name: str = "Order Management Service"
     app_version: str = "1.0.0"
@@ -30,6 +35,17 @@ class Settings(BaseSettings):
         "C2y6yDjf5/R+ob0N8A7Cgv30VRDJIWEHLM+4QDU5DE2nQ9nDuVTqobD4b8mGGyPMbIZnqyMsEcaGQy67XIw/Jw=="
     )
 
+    # Analytics caching (seconds); closed historical ranges never change
+    analytics_cache_ttl: int = 60
+    analytics_historical_cache_ttl: int = 86400
+    analytics_cache_max_entries: int = 512
+
+    # Order list totals are approximate for a few seconds after writes
+    order_count_cache_ttl: int = 5
+
+    # Upper bound on post-persist order side effects running at once
+    order_side_effect_concurrency: int = Field(default=64, ge=1)
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -39,24 +55,24 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-
-    @property
-    def use_cosmos_emulator(self) -> bool:
-        """Check if we should use the Cosmos DB emulator."""
-        return self.cosmos_endpoint is None
-
-    @property
-    def effective_cosmos_endpoint(self) -> str:
-        """Get the effective Cosmos DB endpoint."""
-        return self.cosmos_endpoint or self.cosmos_emulator_endpoint
-
-    @property
-    def effective_cosmos_key(self) -> str:
-        """Get the effective Cosmos DB key."""
-        return self.cosmos_key or self.cosmos_emulator_key
+    # Derived Cosmos DB connection settings, resolved once at load time
+    use_cosmos_emulator: bool = False
+    effective_cosmos_endpoint: str = ""
+    effective_cosmos_key: str = ""
+
+    @model_validator(mode="after")
+    def resolve_cosmos_connection(self) -> "Settings":
+        """Resolve the emulator fallbacks so reads are plain attribute access."""
+        object.__setattr__(self, "use_cosmos_emulator", self.cosmos_endpoint is None)
+        object.__setattr__(
+            self,
+            "effective_cosmos_endpoint",
+            self.cosmos_endpoint or self.cosmos_emulator_endpoint,
+        )
+        object.__setattr__(
+            self, "effective_cosmos_key", self.cosmos_key or self.cosmos_emulator_key
+        )
+        return self
 
 
 @lru_cache()
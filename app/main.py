@@ -1,13 +1,27 @@
 """Main FastAPI application entry point"""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.router import api_router
 from app.core.config import get_settings
+from app.repositories.base import close_cosmos_client, db_manager
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Provision Cosmos DB once at startup and release the client on shutdown."""
+    await db_manager.initialize()
+    yield
+    await close_cosmos_client()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
@@ -15,6 +29,8 @@ app = FastAPI(
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -7,7 +7,7 @@ from .analytics import (
     RevenueMetrics,
 )
 from .base import OrderStatus, PaymentMethod, PaymentStatus, TimestampMixin
-from .order import Address, Order, OrderItem, PaymentInfo
+from .order import Address, Order, OrderItem, OrderSummary, PaymentInfo
 
 __all__ = [
     "OrderStatus",
@@ -16,6 +16,7 @@ __all__ = [
     "TimestampMixin",
     "Order",
     "OrderItem",
+    "OrderSummary",
     "Address",
     "PaymentInfo",
     "DailyOrderMetrics",
@@ -1,14 +1,16 @@
 """Base data models and enumerations"""
 
-import uuid
+import os
+import re
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from decimal import Decimal
+from enum import StrEnum
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field, PlainSerializer
 
 
-class OrderStatus(str, Enum):
+class OrderStatus(StrEnum):
     """Order status enumeration"""
 
     PENDING = "pending"
@@ -20,7 +22,7 @@ class OrderStatus(str, Enum):
     REFUNDED = "refunded"
 
 
-class PaymentStatus(str, Enum):
+class PaymentStatus(StrEnum):
     """Payment status enumeration"""
 
     PENDING = "pending"
@@ -30,7 +32,7 @@ class PaymentStatus(str, Enum):
     REFUNDED = "refunded"
 
 
-class PaymentMethod(str, Enum):
+class PaymentMethod(StrEnum):
     """Payment method enumeration"""
 
     CREDIT_CARD = "credit_card"
@@ -40,9 +42,30 @@ class PaymentMethod(str, Enum):
     GOOGLE_PAY = "google_pay"
 
 
+# Monetary amounts stay Decimal in Python and are emitted as JSON numbers
+Money = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+EMAIL_PATTERN = re.compile(r"^[^@]+@[^@]+\.[^@]+$")
+
+
+def validate_email(value: str) -> str:
+    """Check an email address against the precompiled EMAIL_PATTERN"""
+    if not EMAIL_PATTERN.match(value):
+        raise ValueError(f'string does not match regex "{EMAIL_PATTERN.pattern}"')
+    return value
+
+
+# Email addresses checked by validate_email wherever the type is used
+Email = Annotated[str, AfterValidator(validate_email)]
+
+
 def generate_uuid() -> str:
-    """Generate a UUID string"""
-    return str(uuid.uuid4())
+    """Generate a random (version 4) UUID as a 32-character hex string"""
+    # Set the version and variant bits directly instead of building a UUID object
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    return raw.hex()
 
 
 class TimestampMixin(BaseModel):
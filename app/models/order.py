@@ -4,9 +4,18 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from app.models.base import (
+    Email,
+    Money,
     OrderStatus,
     PaymentMethod,
     PaymentStatus,
@@ -14,6 +23,9 @@ from app.models.base import (
     generate_uuid,
 )
 
+# Tolerance for rounding differences in order totals
+_CENT = Decimal("0.01")
+
 
 class Address(BaseModel):
     """Address model"""
@@ -31,12 +43,14 @@ class OrderItem(BaseModel):
     product_id: str = Field(..., min_length=1)
     product_name: str = Field(..., min_length=1, max_length=255)
     quantity: int = Field(..., ge=1, le=1000)
-    unit_price: Decimal = Field(..., ge=0, decimal_places=2)
-    total_price: Decimal = Field(..., ge=0, decimal_places=2)
+    unit_price: Money = Field(..., ge=0, decimal_places=2)
+    total_price: Money = Field(..., ge=0, decimal_places=2)
 
-    @validator("total_price")
-    def validate_total_price(cls, v, values):
+    @field_validator("total_price")
+    @classmethod
+    def validate_total_price(cls, v: Decimal, info: ValidationInfo) -> Decimal:
         """Validate that total_price equals quantity * unit_price"""
+        values = info.data
         if "quantity" in values and "unit_price" in values:
             expected_total = values["quantity"] * values["unit_price"]
             if v != expected_total:
@@ -62,25 +76,25 @@ class Order(TimestampMixin):
     # Cosmos DB specific fields
     id: str = Field(default_factory=generate_uuid, alias="_id")
     partition_key: str = Field(
-        ..., alias="partitionKey"
-    )  # customer_id for partitioning
+        default="", alias="partitionKey"
+    )  # customer_id for partitioning, set during validation
     document_type: str = Field(default="order", alias="type")
 
     # Business fields
     order_number: str = Field(..., min_length=1, max_length=50)
     customer_id: str = Field(..., min_length=1)
-    customer_email: str = Field(..., regex=r"^[^@]+@[^@]+\.[^@]+$")
+    customer_email: Email
 
     # Order details
     status: OrderStatus = Field(default=OrderStatus.PENDING)
-    items: List[OrderItem] = Field(..., min_items=1, max_items=100)
+    items: List[OrderItem] = Field(..., min_length=1, max_length=100)
 
     # Pricing
-    subtotal: Decimal = Field(..., ge=0, decimal_places=2)
-    tax_amount: Decimal = Field(default=Decimal("0.00"), ge=0, decimal_places=2)
-    shipping_amount: Decimal = Field(default=Decimal("0.00"), ge=0, decimal_places=2)
-    discount_amount: Decimal = Field(default=Decimal("0.00"), ge=0, decimal_places=2)
-    total_amount: Decimal = Field(..., ge=0, decimal_places=2)
+    subtotal: Money = Field(..., ge=0, decimal_places=2)
+    tax_amount: Money = Field(default=Decimal("0.00"), ge=0, decimal_places=2)
+    shipping_amount: Money = Field(default=Decimal("0.00"), ge=0, decimal_places=2)
+    discount_amount: Money = Field(default=Decimal("0.00"), ge=0, decimal_places=2)
+    total_amount: Money = Field(..., ge=0, decimal_places=2)
     currency: str = Field(default="USD", min_length=3, max_length=3)
 
     # Addresses
@@ -94,52 +108,47 @@ class Order(TimestampMixin):
     notes: Optional[str] = Field(None, max_length=1000)
     source: str = Field(default="api")  # web, mobile, api, etc.
 
-    class Config:
-        allow_population_by_field_name = True
-        validate_assignment = True
-        use_enum_values = True
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
-
-    @validator("partition_key")
-    def set_partition_key(cls, v, values):
-        """Set partition key to customer_id for optimal partitioning"""
-        if "customer_id" in values:
-            return values["customer_id"]
-        return v
+    model_config = ConfigDict(
+        populate_by_name=True, validate_assignment=True, use_enum_values=True
+    )
+
+    @model_validator(mode="after")
+    def validate_order(self) -> "Order":
+        """Check subtotal and total, and set the partition key, in one pass"""
+        calculated_subtotal = sum(item.total_price for item in self.items)
+        if abs(self.subtotal - calculated_subtotal) > _CENT:
+            raise ValueError(
+                f"Subtotal {self.subtotal} does not match sum of items {calculated_subtotal}"
+            )
 
-    @validator("total_amount")
-    def validate_total_amount(cls, v, values):
-        """Validate total amount calculation"""
-        if all(
-            field in values
-            for field in [
-                "subtotal",
-                "tax_amount",
-                "shipping_amount",
-                "discount_amount",
-            ]
-        ):
-            expected_total = (
-                values["subtotal"]
-                + values["tax_amount"]
-                + values["shipping_amount"]
-                - values["discount_amount"]
+        expected_total = (
+            self.subtotal
+            + self.tax_amount
+            + self.shipping_amount
+            - self.discount_amount
+        )
+        if abs(self.total_amount - expected_total) > _CENT:
+            raise ValueError(
+                f"Total amount {self.total_amount} does not match calculated total {expected_total}"
             )
-            if abs(v - expected_total) > Decimal(
-                "0.01"
-            ):  # Allow for rounding differences
-                raise ValueError(
-                    f"Total amount {v} does not match calculated total {expected_total}"
-                )
-        return v
 
-    @validator("subtotal")
-    def validate_subtotal(cls, v, values):
-        """Validate subtotal matches sum of item totals"""
-        if "items" in values:
-            calculated_subtotal = sum(item.total_price for item in values["items"])
-            if abs(v - calculated_subtotal) > Decimal("0.01"):
-                raise ValueError(
-                    f"Subtotal {v} does not match sum of items {calculated_subtotal}"
-                )
-        return v
+        # Partition orders by customer; written to __dict__ directly because
+        # attribute assignment would re-run this validator
+        self.__dict__["partition_key"] = self.customer_id
+        return self
+
+
+class OrderSummary(BaseModel):
+    """Order header fields for list views, without items or addresses"""
+
+    id: str = Field(..., alias="_id")
+    partition_key: str = Field(..., alias="partitionKey")
+    order_number: str
+    customer_id: str
+    customer_email: str
+    status: OrderStatus
+    total_amount: Money
+    currency: str = "USD"
+    created_at: datetime
+
+    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
@@ -1,70 +1,107 @@
 """Base repository pattern implementation"""
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, List, Optional, TypeVar
+from typing import ClassVar, Dict, Generic, List, Optional, Tuple, TypeVar
 
-from azure.cosmos import ContainerProxy, CosmosClient, DatabaseProxy
-from azure.cosmos.exceptions import CosmosResourceNotFoundError
+from azure.cosmos import PartitionKey
+from azure.cosmos.aio import ContainerProxy, CosmosClient, DatabaseProxy
+from azure.cosmos.exceptions import CosmosResourceExistsError
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+# Composite indexes backing the date-range analytics queries: every analytics
+# query filters on type + created_at, grouped ones additionally on status, and
+# the customer index serves per-customer lookups filtered by created_at.
+ORDERS_INDEXING_POLICY = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    "includedPaths": [{"path": "/*"}],
+    "excludedPaths": [{"path": '/"_etag"/?'}],
+    "compositeIndexes": [
+        [
+            {"path": "/type", "order": "ascending"},
+            {"path": "/created_at", "order": "ascending"},
+        ],
+        [
+            {"path": "/status", "order": "ascending"},
+            {"path": "/created_at", "order": "ascending"},
+        ],
+        [
+            {"path": "/customer_id", "order": "ascending"},
+            {"path": "/created_at", "order": "descending"},
+        ],
+    ],
+}
+
+# One async client (and its connection pool) per process, shared by every
+# repository. Created lazily so it binds to the running event loop.
+_cosmos_client: Optional[CosmosClient] = None
+_containers: Dict[Tuple[str, str], ContainerProxy] = {}
+
+
+def get_cosmos_client() -> CosmosClient:
+    """Get the shared Cosmos client, creating it on first use"""
+    global _cosmos_client
+    if _cosmos_client is None:
+        settings = get_settings()
+        _cosmos_client = CosmosClient(
+            settings.effective_cosmos_endpoint, settings.effective_cosmos_key
+        )
+    return _cosmos_client
+
+
+def get_container(database_name: str, container_name: str) -> ContainerProxy:
+    """Get a cached container proxy from the shared Cosmos client"""
+    key = (database_name, container_name)
+    container = _containers.get(key)
+    if container is None:
+        container = (
+            get_cosmos_client()
+            .get_database_client(database_name)
+            .get_container_client(container_name)
+        )
+        _containers[key] = container
+    return container
+
+
+async def close_cosmos_client() -> None:
+    """Close the shared Cosmos client and drop cached container proxies"""
+    global _cosmos_client
+    _containers.clear()
+    if _cosmos_client is not None:
+        await _cosmos_client.close()
+        _cosmos_client = None
+
 
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository class"""
 
-    def __init__(self):
-        self.settings = get_settings()
-        self._client: Optional[CosmosClient] = None
-        self._database: Optional[DatabaseProxy] = None
-        self._container: Optional[ContainerProxy] = None
+    settings: ClassVar[Settings] = get_settings()
 
+    # Proxies are looked up from the module-level caches on each access rather
+    # than held per instance, so long-lived repositories always use the
+    # current shared client.
     @property
     def client(self) -> CosmosClient:
-        """Get or create Cosmos client"""
-        if not self._client:
-            self._client = CosmosClient(
-                self.settings.effective_cosmos_endpoint,
-                self.settings.effective_cosmos_key,
-            )
-        return self._client
+        """Get the shared Cosmos client"""
+        return get_cosmos_client()
 
     @property
     def database(self) -> DatabaseProxy:
-        """Get or create database"""
-        if not self._database:
-            self._database = self.client.get_database_client(
-                self.settings.cosmos_database
-            )
-        return self._database
+        """Get the configured database proxy"""
+        return self.client.get_database_client(self.settings.cosmos_database)
 
     @property
     def container(self) -> ContainerProxy:
-        """Get or create container"""
-        if not self._container:
-            self._container = self.database.get_container_client(
-                self.settings.cosmos_container
-            )
-        return self._container
-
-    async def create_database_if_not_exists(self) -> None:
-        """Create database if it doesn't exist"""
-        try:
-            self.client.create_database(self.settings.cosmos_database)
-        except:
-            pass  # Database already exists
-
-    async def create_container_if_not_exists(self) -> None:
-        """Create container if it doesn't exist"""
-        try:
-            self.database.create_container(
-                id=self.settings.cosmos_container,
-                partition_key="/partitionKey",
-                offer_throughput=400,
-            )
-        except:
-            pass  # Container already exists
+        """Get the shared container proxy"""
+        return get_container(
+            self.settings.cosmos_database, self.settings.cosmos_container
+        )
 
     @abstractmethod
     async def create(self, item: T) -> T:
@@ -97,8 +134,9 @@ class BaseRepository(ABC, Generic[T]):
 class DatabaseManager:
     """Database initialization and management"""
 
+    settings: ClassVar[Settings] = get_settings()
+
     def __init__(self):
-        self.settings = get_settings()
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -107,37 +145,39 @@ class DatabaseManager:
             return
 
         try:
-            client = CosmosClient(
-                self.settings.effective_cosmos_endpoint,
-                self.settings.effective_cosmos_key,
-            )
+            client = get_cosmos_client()
 
             # Create database
             try:
-                client.create_database(self.settings.cosmos_database)
-                print(f"Created database: {self.settings.cosmos_database}")
-            except:
-                print(f"Database {self.settings.cosmos_database} already exists")
+                await client.create_database(self.settings.cosmos_database)
+                logger.debug("Created database %s", self.settings.cosmos_database)
+            except CosmosResourceExistsError:
+                logger.debug(
+                    "Database %s already exists", self.settings.cosmos_database
+                )
 
             # Get database client
             database = client.get_database_client(self.settings.cosmos_database)
 
             # Create container
             try:
-                database.create_container(
+                await database.create_container(
                     id=self.settings.cosmos_container,
-                    partition_key="/partitionKey",
+                    partition_key=PartitionKey(path="/partitionKey"),
+                    indexing_policy=ORDERS_INDEXING_POLICY,
                     offer_throughput=400,
                 )
-                print(f"Created container: {self.settings.cosmos_container}")
-            except:
-                print(f"Container {self.settings.cosmos_container} already exists")
+                logger.debug("Created container %s", self.settings.cosmos_container)
+            except CosmosResourceExistsError:
+                logger.debug(
+                    "Container %s already exists", self.settings.cosmos_container
+                )
 
             self._initialized = True
-            print("Database initialization completed successfully")
+            logger.debug("Database initialization completed")
 
-        except Exception as e:
-            print(f"Database initialization failed: {e}")
+        except Exception:
+            logger.exception("Database initialization failed")
             raise
 
 
@@ -3,91 +3,202 @@
 import json
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple, cast
 
+from azure.core.async_paging import AsyncPageIterator
 from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
 from app.models.analytics import CustomerMetrics, DailyOrderMetrics, OrderStatusMetrics
 from app.models.base import OrderStatus
-from app.models.order import Order
+from app.models.order import Order, OrderSummary
 from app.repositories.base import BaseRepository
 
+# Revenue reported for periods without orders
+_ZERO_AMOUNT = Decimal("0.00")
+
+# Order lookups bind status and paging values as parameters so the query text
+# stays constant and user input never reaches the SQL itself. Customer filters
+# are applied by passing the partition key rather than a WHERE predicate.
+ORDERS_PAGE_QUERY = """
+SELECT * FROM c
+WHERE c.type = 'order'
+ORDER BY c.created_at DESC
+OFFSET @offset LIMIT @limit
+"""
+ORDER_COUNT_QUERY = """
+SELECT VALUE COUNT(1) FROM c
+WHERE c.type = 'order'
+"""
+ORDER_COUNT_BY_STATUS_QUERY = """
+SELECT VALUE COUNT(1) FROM c
+WHERE c.type = 'order'
+AND c.status = @status
+"""
+# Header-only projections for list views; line items, addresses and payment
+# details are the bulk of each document and are not read or billed here.
+ORDER_SUMMARIES_PAGE_QUERY = """
+SELECT
+    c._id,
+    c.partitionKey,
+    c.order_number,
+    c.customer_id,
+    c.customer_email,
+    c.status,
+    c.total_amount,
+    c.currency,
+    c.created_at
+FROM c
+WHERE c.type = 'order'
+ORDER BY c.created_at DESC
+OFFSET @offset LIMIT @limit
+"""
+ORDER_SUMMARIES_NEWEST_FIRST_QUERY = """
+SELECT
+    c._id,
+    c.partitionKey,
+    c.order_number,
+    c.customer_id,
+    c.customer_email,
+    c.status,
+    c.total_amount,
+    c.currency,
+    c.created_at
+FROM c
+WHERE c.type = 'order'
+ORDER BY c.created_at DESC
+"""
+ORDER_SUMMARIES_BY_STATUS_QUERY = """
+SELECT
+    c._id,
+    c.partitionKey,
+    c.order_number,
+    c.customer_id,
+    c.customer_email,
+    c.status,
+    c.total_amount,
+    c.currency,
+    c.created_at
+FROM c
+WHERE c.type = 'order'
+AND c.status = @status
+ORDER BY c.created_at DESC
+OFFSET @offset LIMIT @limit
+"""
+ORDER_BY_NUMBER_QUERY = """
+SELECT * FROM c
+WHERE c.type = 'order'
+AND c.order_number = @order_number
+"""
+
+# Analytics queries are fixed text with bound parameters, so they are built
+# once here and Cosmos DB can reuse its cached query plans across requests.
+DAILY_METRICS_QUERY = """
+SELECT
+    SUBSTRING(c.created_at, 0, 10) as date,
+    COUNT(1) as order_count,
+    SUM(c.total_amount) as total_revenue,
+    AVG(c.total_amount) as average_order_value,
+    c.currency
+FROM c
+WHERE c.type = 'order'
+AND c.created_at BETWEEN @start_date AND @end_date
+GROUP BY SUBSTRING(c.created_at, 0, 10), c.currency
+ORDER BY SUBSTRING(c.created_at, 0, 10)
+"""
+ORDER_STATUS_METRICS_QUERY = """
+SELECT
+    c.status,
+    COUNT(1) as count,
+    SUM(c.total_amount) as total_value
+FROM c
+WHERE c.type = 'order'
+AND c.created_at BETWEEN @start_date AND @end_date
+GROUP BY c.status
+"""
+CUSTOMER_METRICS_QUERY = """
+SELECT
+    c.customer_id,
+    c.customer_email,
+    COUNT(1) as total_orders,
+    SUM(c.total_amount) as total_spent,
+    AVG(c.total_amount) as average_order_value,
+    MIN(c.created_at) as first_order_date,
+    MAX(c.created_at) as last_order_date
+FROM c
+WHERE c.type = 'order'
+AND c.created_at BETWEEN @start_date AND @end_date
+GROUP BY c.customer_id, c.customer_email
+ORDER BY SUM(c.total_amount) DESC
+OFFSET 0 LIMIT @limit
+"""
+SINGLE_CUSTOMER_METRICS_QUERY = """
+SELECT
+    c.customer_id,
+    c.customer_email,
+    COUNT(1) as total_orders,
+    SUM(c.total_amount) as total_spent,
+    AVG(c.total_amount) as average_order_value,
+    MIN(c.created_at) as first_order_date,
+    MAX(c.created_at) as last_order_date
+FROM c
+WHERE c.type = 'order'
+AND c.customer_id = @customer_id
+AND c.created_at BETWEEN @start_date AND @end_date
+GROUP BY c.customer_id, c.customer_email
+"""
+REVENUE_SUMMARY_QUERY = """
+SELECT
+    SUM(c.total_amount) as total_revenue,
+    COUNT(1) as total_orders,
+    AVG(c.total_amount) as average_order_value
+FROM c
+WHERE c.type = 'order'
+AND c.created_at BETWEEN @start_date AND @end_date
+"""
+DAILY_STATUS_ROLLUP_QUERY = """
+SELECT
+    SUBSTRING(c.created_at, 0, 10) as date,
+    c.status,
+    c.currency,
+    COUNT(1) as order_count,
+    SUM(c.total_amount) as total_revenue
+FROM c
+WHERE c.type = 'order'
+AND c.created_at BETWEEN @start_date AND @end_date
+GROUP BY SUBSTRING(c.created_at, 0, 10), c.status, c.currency
+"""
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a numeric aggregate from a query row to Decimal
+
+    Integral sums are converted exactly without a string round trip; doubles
+    go through their shortest round-trip repr so no binary noise leaks in.
+    """
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(repr(value))
+
 
 class OrderRepository(BaseRepository[Order]):
     """Repository for order operations with Azure Cosmos DB"""
 
     def _order_from_dict(self, data: Dict[str, Any]) -> Order:
         """Convert Cosmos DB document to Order model"""
-        # Handle Decimal conversion
-        for field in [
-            "subtotal",
-            "tax_amount",
-            "shipping_amount",
-            "discount_amount",
-            "total_amount",
-        ]:
-            if field in data:
-                data[field] = Decimal(str(data[field]))
-
-        # Handle nested item total_price conversion
-        if "items" in data:
-            for item in data["items"]:
-                if "total_price" in item:
-                    item["total_price"] = Decimal(str(item["total_price"]))
-                if "unit_price" in item:
-                    item["unit_price"] = Decimal(str(item["unit_price"]))
-
-        # Convert datetime strings back to datetime objects if needed
-        for field in ["created_at", "updated_at"]:
-            if field in data and isinstance(data[field], str):
-                try:
-                    data[field] = datetime.fromisoformat(
-                        data[field].replace("Z", "+00:00")
-                    )
-                except:
-                    pass
-
-        return Order(**data)
+        # The model's compiled validator turns stored floats back into Decimal
+        # amounts and ISO strings into datetimes in a single pass.
+        return Order.model_validate(data)
 
     def _order_to_dict(self, order: Order) -> Dict[str, Any]:
         """Convert Order model to Cosmos DB document format"""
-        data = order.dict(by_alias=True)
-
-        # Convert Decimal to float for Cosmos DB storage
-        for field in [
-            "subtotal",
-            "tax_amount",
-            "shipping_amount",
-            "discount_amount",
-            "total_amount",
-        ]:
-            if field in data and isinstance(data[field], Decimal):
-                data[field] = float(data[field])
-
-        # Handle nested items
-        if "items" in data:
-            for item in data["items"]:
-                if "total_price" in item and isinstance(item["total_price"], Decimal):
-                    item["total_price"] = float(item["total_price"])
-                if "unit_price" in item and isinstance(item["unit_price"], Decimal):
-                    item["unit_price"] = float(item["unit_price"])
-
-        # Ensure datetime objects are ISO formatted
-        for field in ["created_at", "updated_at"]:
-            if field in data and isinstance(data[field], datetime):
-                data[field] = data[field].isoformat()
-
-        return data
+        # JSON mode stores Money amounts as floats and datetimes as ISO strings
+        return order.model_dump(by_alias=True, mode="json")
 
     async def create(self, order: Order) -> Order:
         """Create a new order"""
         try:
-            # Ensure database and container exist
-            await self.create_database_if_not_exists()
-            await self.create_container_if_not_exists()
-
             order_dict = self._order_to_dict(order)
-            created_item = self.container.create_item(order_dict)
+            created_item = await self.container.create_item(order_dict)
             return self._order_from_dict(created_item)
         except Exception as e:
             raise RuntimeError(f"Failed to create order: {str(e)}")
@@ -95,7 +206,9 @@ class OrderRepository(BaseRepository[Order]):
     async def get_by_id(self, order_id: str, customer_id: str) -> Optional[Order]:
         """Get order by ID and customer ID (partition key)"""
         try:
-            item = self.container.read_item(item=order_id, partition_key=customer_id)
+            item = await self.container.read_item(
+                item=order_id, partition_key=customer_id
+            )
             return self._order_from_dict(item)
         except CosmosResourceNotFoundError:
             return None
@@ -108,7 +221,9 @@ class OrderRepository(BaseRepository[Order]):
             order.updated_at = datetime.utcnow()
             order_dict = self._order_to_dict(order)
 
-            updated_item = self.container.replace_item(item=order.id, body=order_dict)
+            updated_item = await self.container.replace_item(
+                item=order.id, body=order_dict
+            )
             return self._order_from_dict(updated_item)
         except CosmosResourceNotFoundError:
             raise ValueError(f"Order {order.id} not found")
@@ -118,7 +233,7 @@ class OrderRepository(BaseRepository[Order]):
     async def delete(self, order_id: str, customer_id: str) -> bool:
         """Delete an order"""
         try:
-            self.container.delete_item(item=order_id, partition_key=customer_id)
+            await self.container.delete_item(item=order_id, partition_key=customer_id)
             return True
         except CosmosResourceNotFoundError:
             return False
@@ -130,112 +245,139 @@ class OrderRepository(BaseRepository[Order]):
     ) -> List[Order]:
         """List orders with optional customer filter and pagination"""
         try:
-            if customer_id:
-                # Query orders for specific customer
-                query = f"""
-                    SELECT * FROM c 
-                    WHERE c.type = 'order' 
-                    AND c.partitionKey = '{customer_id}'
-                    ORDER BY c.created_at DESC
-                    OFFSET {offset} LIMIT {max_items}
-                """
-            else:
-                # Query all orders (cross-partition)
-                query = f"""
-                    SELECT * FROM c 
-                    WHERE c.type = 'order'
-                    ORDER BY c.created_at DESC
-                    OFFSET {offset} LIMIT {max_items}
-                """
-
-            items = list(
-                self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+            # Scoped to one partition for a customer, cross-partition otherwise;
+            # the SDK page size matches LIMIT so a page is one round trip
+            return [
+                self._order_from_dict(item)
+                async for item in self.container.query_items(
+                    query=ORDERS_PAGE_QUERY,
+                    parameters=[
+                        {"name": "@offset", "value": offset},
+                        {"name": "@limit", "value": max_items},
+                    ],
+                    partition_key=customer_id or None,
+                    max_item_count=max_items,
+                )
+            ]
+        except Exception as e:
+            raise RuntimeError(f"Failed to list orders: {str(e)}")
+
+    async def list_items_summary(
+        self, customer_id: Optional[str] = None, max_items: int = 100, offset: int = 0
+    ) -> List[OrderSummary]:
+        """List order headers with optional customer filter and pagination"""
+        try:
+            return [
+                OrderSummary.model_validate(item)
+                async for item in self.container.query_items(
+                    query=ORDER_SUMMARIES_PAGE_QUERY,
+                    parameters=[
+                        {"name": "@offset", "value": offset},
+                        {"name": "@limit", "value": max_items},
+                    ],
+                    partition_key=customer_id or None,
+                    max_item_count=max_items,
                 )
+            ]
+        except Exception as e:
+            raise RuntimeError(f"Failed to list order summaries: {str(e)}")
+
+    async def list_items_summary_page(
+        self,
+        customer_id: str,
+        max_items: int = 100,
+        continuation_token: Optional[str] = None,
+    ) -> Tuple[List[OrderSummary], Optional[str]]:
+        """List one page of a customer's order headers, resuming from a token
+
+        Unlike OFFSET paging, each page costs the same however deep it is.
+        Seek paging is limited to a single partition: the token of a
+        cross-partition ORDER BY only covers one partition's sub-query and
+        cannot resume the merged stream. Returns the headers and the token for
+        the next page, or None at the end.
+        """
+        try:
+            pages = cast(
+                AsyncPageIterator,
+                self.container.query_items(
+                    query=ORDER_SUMMARIES_NEWEST_FIRST_QUERY,
+                    partition_key=customer_id,
+                    max_item_count=max_items,
+                ).by_page(continuation_token),
             )
 
-            return [self._order_from_dict(item) for item in items]
+            summaries: List[OrderSummary] = []
+            async for page in pages:
+                summaries = [OrderSummary.model_validate(item) async for item in page]
+                break
+
+            return summaries, pages.continuation_token
         except Exception as e:
-            raise RuntimeError(f"Failed to list orders: {str(e)}")
+            raise RuntimeError(f"Failed to list order summaries: {str(e)}")
 
-    async def get_orders_by_status(
+    async def get_orders_by_status_summary(
         self,
         status: OrderStatus,
         customer_id: Optional[str] = None,
         max_items: int = 100,
-    ) -> List[Order]:
-        """Get orders by status"""
+        offset: int = 0,
+    ) -> List[OrderSummary]:
+        """Get one page of order headers by status"""
         try:
-            if customer_id:
-                query = f"""
-                    SELECT * FROM c 
-                    WHERE c.type = 'order' 
-                    AND c.partitionKey = '{customer_id}'
-                    AND c.status = '{status.value}'
-                    ORDER BY c.created_at DESC
-                """
-            else:
-                query = f"""
-                    SELECT * FROM c 
-                    WHERE c.type = 'order'
-                    AND c.status = '{status.value}'
-                    ORDER BY c.created_at DESC
-                """
-
-            items = list(
-                self.container.query_items(
-                    query=query,
-                    enable_cross_partition_query=True,
+            return [
+                OrderSummary.model_validate(item)
+                async for item in self.container.query_items(
+                    query=ORDER_SUMMARIES_BY_STATUS_QUERY,
+                    parameters=[
+                        {"name": "@status", "value": status.value},
+                        {"name": "@offset", "value": offset},
+                        {"name": "@limit", "value": max_items},
+                    ],
+                    partition_key=customer_id or None,
                     max_item_count=max_items,
                 )
-            )
-
-            return [self._order_from_dict(item) for item in items]
+            ]
         except Exception as e:
-            raise RuntimeError(f"Failed to get orders by status {status}: {str(e)}")
+            raise RuntimeError(
+                f"Failed to get order summaries by status {status}: {str(e)}"
+            )
 
-    async def count_orders(self, customer_id: Optional[str] = None) -> int:
-        """Count total orders"""
+    async def count_orders(
+        self, customer_id: Optional[str] = None, status: Optional[OrderStatus] = None
+    ) -> int:
+        """Count total orders, optionally only those with the given status"""
         try:
-            if customer_id:
-                query = f"""
-                    SELECT VALUE COUNT(1) FROM c 
-                    WHERE c.type = 'order' 
-                    AND c.partitionKey = '{customer_id}'
-                """
+            if status:
+                query = ORDER_COUNT_BY_STATUS_QUERY
+                parameters = [{"name": "@status", "value": status.value}]
             else:
-                query = """
-                    SELECT VALUE COUNT(1) FROM c 
-                    WHERE c.type = 'order'
-                """
+                query, parameters = ORDER_COUNT_QUERY, []
 
-            result = list(
+            item = await self._first_item(
                 self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+                    query=query,
+                    parameters=parameters,
+                    partition_key=customer_id or None,
                 )
             )
 
-            return result[0] if result else 0
+            return int(item) if item is not None else 0
         except Exception as e:
             raise RuntimeError(f"Failed to count orders: {str(e)}")
 
     async def get_order_by_number(self, order_number: str) -> Optional[Order]:
         """Get order by order number (cross-partition query)"""
         try:
-            query = f"""
-                SELECT * FROM c 
-                WHERE c.type = 'order' 
-                AND c.order_number = '{order_number}'
-            """
-
-            items = list(
+            item = await self._first_item(
                 self.container.query_items(
-                    query=query, enable_cross_partition_query=True, max_item_count=1
+                    query=ORDER_BY_NUMBER_QUERY,
+                    parameters=[{"name": "@order_number", "value": order_number}],
+                    max_item_count=1,
                 )
             )
 
-            if items:
-                return self._order_from_dict(items[0])
+            if item:
+                return self._order_from_dict(item)
             return None
         except Exception as e:
             raise RuntimeError(
@@ -244,93 +386,97 @@ class OrderRepository(BaseRepository[Order]):
 
     # Analytics Methods
 
+    @staticmethod
+    async def _first_item(items: AsyncIterable[Any]) -> Any:
+        """Return the first query result without fetching further pages
+
+        Results are documents, or bare scalars for SELECT VALUE queries; None
+        means the query returned nothing.
+        """
+        async for item in items:
+            return item
+        return None
+
+    @staticmethod
+    def _date_range_parameters(
+        start_date: date, end_date: date
+    ) -> List[Dict[str, Any]]:
+        """Build inclusive created_at bounds for a date range query"""
+        # created_at is stored as an ISO string, so the bare start date sorts
+        # before any timestamp on that day and the upper bound after any
+        # timestamp (naive or offset-suffixed) on the end date.
+        return [
+            {"name": "@start_date", "value": start_date.isoformat()},
+            {"name": "@end_date", "value": f"{end_date.isoformat()}T23:59:59.999999Z"},
+        ]
+
+    @staticmethod
+    def _customer_metrics_from_dict(item: Dict[str, Any]) -> CustomerMetrics:
+        """Convert a grouped customer query row to CustomerMetrics"""
+        first_order_date = None
+        last_order_date = None
+
+        # fromisoformat accepts a trailing "Z" since Python 3.11
+        if item.get("first_order_date"):
+            first_order_date = datetime.fromisoformat(item["first_order_date"])
+        if item.get("last_order_date"):
+            last_order_date = datetime.fromisoformat(item["last_order_date"])
+
+        return CustomerMetrics(
+            customer_id=item["customer_id"],
+            customer_email=item["customer_email"],
+            total_orders=item["total_orders"],
+            total_spent=_to_decimal(item["total_spent"]),
+            average_order_value=_to_decimal(item["average_order_value"]),
+            first_order_date=first_order_date,
+            last_order_date=last_order_date,
+        )
+
     async def get_daily_metrics(
         self, start_date: date, end_date: date
     ) -> List[DailyOrderMetrics]:
         """Get daily order metrics for a date range"""
         try:
-            query = f"""
-                SELECT 
-                    SUBSTRING(c.created_at, 0, 10) as date,
-                    COUNT(1) as order_count,
-                    SUM(c.total_amount) as total_revenue,
-                    AVG(c.total_amount) as average_order_value,
-                    c.currency
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-                GROUP BY SUBSTRING(c.created_at, 0, 10), c.currency
-                ORDER BY SUBSTRING(c.created_at, 0, 10)
-            """
-
-            items = list(
-                self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+            return [
+                DailyOrderMetrics(
+                    date=date.fromisoformat(item["date"]),
+                    order_count=item["order_count"],
+                    total_revenue=_to_decimal(item["total_revenue"]),
+                    average_order_value=_to_decimal(item["average_order_value"]),
+                    currency=item["currency"],
                 )
-            )
-
-            daily_metrics = []
-            for item in items:
-                daily_metrics.append(
-                    DailyOrderMetrics(
-                        date=datetime.fromisoformat(item["date"]).date(),
-                        order_count=item["order_count"],
-                        total_revenue=Decimal(str(item["total_revenue"])),
-                        average_order_value=Decimal(str(item["average_order_value"])),
-                        currency=item["currency"],
-                    )
+                async for item in self.container.query_items(
+                    query=DAILY_METRICS_QUERY,
+                    parameters=self._date_range_parameters(start_date, end_date),
                 )
-
-            return daily_metrics
+            ]
 
         except Exception as e:
             raise RuntimeError(f"Failed to get daily metrics: {str(e)}")
 
     async def get_order_status_metrics(
         self, start_date: date, end_date: date
-    ) -> List[OrderStatusMetrics]:
-        """Get order metrics grouped by status"""
+    ) -> Tuple[List[OrderStatusMetrics], int, Decimal]:
+        """Get order metrics grouped by status, plus order and revenue totals"""
         try:
-            # First get total count for percentage calculation
-            total_query = f"""
-                SELECT COUNT(1) as total_count, SUM(c.total_amount) as total_value
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-            """
-
-            total_result = list(
-                self.container.query_items(
-                    query=total_query, enable_cross_partition_query=True
+            # One grouped scan; the overall totals are sums of the status groups
+            items = [
+                item
+                async for item in self.container.query_items(
+                    query=ORDER_STATUS_METRICS_QUERY,
+                    parameters=self._date_range_parameters(start_date, end_date),
                 )
-            )
+            ]
 
-            total_orders = total_result[0]["total_count"] if total_result else 0
-
-            # Get metrics by status
-            query = f"""
-                SELECT 
-                    c.status,
-                    COUNT(1) as count,
-                    SUM(c.total_amount) as total_value
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-                GROUP BY c.status
-                ORDER BY COUNT(1) DESC
-            """
-
-            items = list(
-                self.container.query_items(
-                    query=query, enable_cross_partition_query=True
-                )
-            )
+            # Only one row per status comes back, so ordering here is trivial
+            items.sort(key=lambda item: item["count"], reverse=True)
+            total_orders = sum(item["count"] for item in items)
 
+            total_revenue = _ZERO_AMOUNT
             status_metrics = []
             for item in items:
+                total_value = _to_decimal(item["total_value"])
+                total_revenue += total_value
                 percentage = (
                     (item["count"] / total_orders * 100) if total_orders > 0 else 0
                 )
@@ -338,12 +484,12 @@ class OrderRepository(BaseRepository[Order]):
                     OrderStatusMetrics(
                         status=item["status"],
                         count=item["count"],
-                        total_value=Decimal(str(item["total_value"])),
+                        total_value=total_value,
                         percentage=round(percentage, 2),
                     )
                 )
 
-            return status_metrics
+            return status_metrics, total_orders, total_revenue
 
         except Exception as e:
             raise RuntimeError(f"Failed to get order status metrics: {str(e)}")
@@ -353,159 +499,86 @@ class OrderRepository(BaseRepository[Order]):
     ) -> List[CustomerMetrics]:
         """Get top customer metrics by total spending"""
         try:
-            query = f"""
-                SELECT 
-                    c.customer_id,
-                    c.customer_email,
-                    COUNT(1) as total_orders,
-                    SUM(c.total_amount) as total_spent,
-                    AVG(c.total_amount) as average_order_value,
-                    MIN(c.created_at) as first_order_date,
-                    MAX(c.created_at) as last_order_date
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-                GROUP BY c.customer_id, c.customer_email
-                ORDER BY SUM(c.total_amount) DESC
-                OFFSET 0 LIMIT {limit}
-            """
-
-            items = list(
-                self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+            parameters = self._date_range_parameters(start_date, end_date)
+            parameters.append({"name": "@limit", "value": limit})
+
+            return [
+                self._customer_metrics_from_dict(item)
+                async for item in self.container.query_items(
+                    query=CUSTOMER_METRICS_QUERY, parameters=parameters
                 )
-            )
+            ]
 
-            customer_metrics = []
-            for item in items:
-                first_order_date = None
-                last_order_date = None
+        except Exception as e:
+            raise RuntimeError(f"Failed to get customer metrics: {str(e)}")
 
-                if item.get("first_order_date"):
-                    first_order_date = datetime.fromisoformat(
-                        item["first_order_date"].replace("Z", "+00:00")
-                    )
-                if item.get("last_order_date"):
-                    last_order_date = datetime.fromisoformat(
-                        item["last_order_date"].replace("Z", "+00:00")
-                    )
+    async def get_metrics_for_customer(
+        self, customer_id: str, start_date: date, end_date: date
+    ) -> Optional[CustomerMetrics]:
+        """Get metrics for a single customer, scoped to their partition"""
+        try:
+            parameters = self._date_range_parameters(start_date, end_date)
+            parameters.append({"name": "@customer_id", "value": customer_id})
 
-                customer_metrics.append(
-                    CustomerMetrics(
-                        customer_id=item["customer_id"],
-                        customer_email=item["customer_email"],
-                        total_orders=item["total_orders"],
-                        total_spent=Decimal(str(item["total_spent"])),
-                        average_order_value=Decimal(str(item["average_order_value"])),
-                        first_order_date=first_order_date,
-                        last_order_date=last_order_date,
-                    )
+            item = await self._first_item(
+                self.container.query_items(
+                    query=SINGLE_CUSTOMER_METRICS_QUERY,
+                    parameters=parameters,
+                    partition_key=customer_id,
                 )
+            )
 
-            return customer_metrics
+            if item:
+                return self._customer_metrics_from_dict(item)
+
+            return None
 
         except Exception as e:
-            raise RuntimeError(f"Failed to get customer metrics: {str(e)}")
+            raise RuntimeError(
+                f"Failed to get metrics for customer {customer_id}: {str(e)}"
+            )
 
     async def get_revenue_summary(
         self, start_date: date, end_date: date
     ) -> Tuple[Decimal, int, Decimal]:
         """Get revenue summary for a period"""
         try:
-            query = f"""
-                SELECT 
-                    SUM(c.total_amount) as total_revenue,
-                    COUNT(1) as total_orders,
-                    AVG(c.total_amount) as average_order_value
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-            """
-
-            items = list(
+            item = await self._first_item(
                 self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+                    query=REVENUE_SUMMARY_QUERY,
+                    parameters=self._date_range_parameters(start_date, end_date),
                 )
             )
 
-            if items and items[0]:
-                item = items[0]
-                total_revenue = Decimal(str(item.get("total_revenue", 0)))
+            if item:
+                total_revenue = _to_decimal(item.get("total_revenue", 0))
                 total_orders = item.get("total_orders", 0)
-                avg_order_value = Decimal(str(item.get("average_order_value", 0)))
+                avg_order_value = _to_decimal(item.get("average_order_value", 0))
                 return total_revenue, total_orders, avg_order_value
 
-            return Decimal("0"), 0, Decimal("0")
+            return _ZERO_AMOUNT, 0, _ZERO_AMOUNT
 
         except Exception as e:
             raise RuntimeError(f"Failed to get revenue summary: {str(e)}")
 
-    async def get_busiest_day(
+    async def get_daily_status_rollup(
         self, start_date: date, end_date: date
-    ) -> Optional[Tuple[date, int]]:
-        """Get the day with the highest order count"""
+    ) -> List[Tuple[date, str, str, int, Decimal]]:
+        """Get order count and revenue per day, status and currency"""
         try:
-            query = f"""
-                SELECT TOP 1
-                    SUBSTRING(c.created_at, 0, 10) as date,
-                    COUNT(1) as order_count
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-                GROUP BY SUBSTRING(c.created_at, 0, 10)
-                ORDER BY COUNT(1) DESC
-            """
-
-            items = list(
-                self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+            return [
+                (
+                    date.fromisoformat(item["date"]),
+                    item["status"],
+                    item["currency"],
+                    item["order_count"],
+                    _to_decimal(item["total_revenue"]),
                 )
-            )
-
-            if items:
-                item = items[0]
-                busiest_date = datetime.fromisoformat(item["date"]).date()
-                order_count = item["order_count"]
-                return busiest_date, order_count
-
-            return None
-
-        except Exception as e:
-            raise RuntimeError(f"Failed to get busiest day: {str(e)}")
-
-    async def get_highest_revenue_day(
-        self, start_date: date, end_date: date
-    ) -> Optional[Tuple[date, Decimal]]:
-        """Get the day with the highest revenue"""
-        try:
-            query = f"""
-                SELECT TOP 1
-                    SUBSTRING(c.created_at, 0, 10) as date,
-                    SUM(c.total_amount) as total_revenue
-                FROM c 
-                WHERE c.type = 'order'
-                AND c.created_at >= '{start_date}T00:00:00Z'
-                AND c.created_at < '{end_date}T23:59:59Z'
-                GROUP BY SUBSTRING(c.created_at, 0, 10)
-                ORDER BY SUM(c.total_amount) DESC
-            """
-
-            items = list(
-                self.container.query_items(
-                    query=query, enable_cross_partition_query=True
+                async for item in self.container.query_items(
+                    query=DAILY_STATUS_ROLLUP_QUERY,
+                    parameters=self._date_range_parameters(start_date, end_date),
                 )
-            )
-
-            if items:
-                item = items[0]
-                revenue_date = datetime.fromisoformat(item["date"]).date()
-                total_revenue = Decimal(str(item["total_revenue"]))
-                return revenue_date, total_revenue
-
-            return None
+            ]
 
         except Exception as e:
-            raise RuntimeError(f"Failed to get highest revenue day: {str(e)}")
+            raise RuntimeError(f"Failed to get daily status rollup: {str(e)}")
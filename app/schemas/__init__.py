@@ -14,6 +14,7 @@ from .order import (
     OrderCreate,
     OrderItemCreate,
     OrderItemResponse,
+    OrderListItemResponse,
     OrderListResponse,
     OrderResponse,
     OrderUpdate,
@@ -25,6 +26,7 @@ __all__ = [
     "OrderCreate",
     "OrderUpdate",
     "OrderResponse",
+    "OrderListItemResponse",
     "OrderListResponse",
     "MessageResponse",
     "AddressSchema",
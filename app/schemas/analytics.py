@@ -1,10 +1,9 @@
 """Request and response schemas for analytics API"""
 
 from datetime import date, datetime
-from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 from app.models.analytics import (
     CustomerMetrics,
@@ -12,6 +11,7 @@ from app.models.analytics import (
     OrderStatusMetrics,
     RevenueMetrics,
 )
+from app.models.base import Money
 
 
 class AnalyticsDateRange(BaseModel):
@@ -20,15 +20,18 @@ class AnalyticsDateRange(BaseModel):
     start_date: date = Field(..., description="Start date for analytics (inclusive)")
     end_date: date = Field(..., description="End date for analytics (inclusive)")
 
-    @validator("end_date")
-    def validate_date_range(cls, v, values):
+    @field_validator("end_date")
+    @classmethod
+    def validate_date_range(cls, v: date, info: ValidationInfo) -> date:
         """Validate that end_date is after start_date"""
+        values = info.data
         if "start_date" in values and v < values["start_date"]:
             raise ValueError("end_date must be after or equal to start_date")
         return v
 
-    @validator("start_date", "end_date")
-    def validate_not_future(cls, v):
+    @field_validator("start_date", "end_date")
+    @classmethod
+    def validate_not_future(cls, v: date) -> date:
         """Validate that dates are not in the future"""
         if v > date.today():
             raise ValueError("Date cannot be in the future")
@@ -57,13 +60,10 @@ class OrderStatusAnalyticsResponse(BaseModel):
     total_orders: int = Field(
         ..., ge=0, description="Total number of orders in the period"
     )
-    total_revenue: Decimal = Field(
+    total_revenue: Money = Field(
         ..., ge=0, decimal_places=2, description="Total revenue in the period"
     )
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v)}
-
 
 class TopCustomersResponse(BaseModel):
     """Response schema for top customers analytics"""
@@ -99,9 +99,6 @@ class AnalyticsSummaryResponse(BaseModel):
         None, description="Day with highest revenue"
     )
 
-    class Config:
-        json_encoders = {Decimal: lambda v: float(v), date: lambda v: v.isoformat()}
-
 
 class AnalyticsQueryParams(BaseModel):
     """Query parameters for analytics endpoints"""
@@ -113,7 +110,8 @@ class AnalyticsQueryParams(BaseModel):
     customer_id: Optional[str] = Field(None, description="Filter by specific customer")
     limit: int = Field(default=10, ge=1, le=100, description="Limit for result sets")
 
-    @validator("start_date", "end_date", pre=True)
+    @field_validator("start_date", "end_date", mode="before")
+    @classmethod
     def parse_dates(cls, v):
         """Parse date strings to date objects"""
         if isinstance(v, str):
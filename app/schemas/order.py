@@ -4,63 +4,61 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from app.models.base import OrderStatus, PaymentMethod, PaymentStatus
+from app.models.base import Email, Money, OrderStatus, PaymentMethod, PaymentStatus
 
 
 class AddressSchema(BaseModel):
     """Address schema for API requests/responses"""
 
-    street: str = Field(..., min_length=1, max_length=255, example="123 Main St")
-    city: str = Field(..., min_length=1, max_length=100, example="Seattle")
-    state: str = Field(..., min_length=2, max_length=50, example="WA")
-    postal_code: str = Field(..., min_length=5, max_length=20, example="98101")
-    country: str = Field(default="US", min_length=2, max_length=2, example="US")
+    street: str = Field(..., min_length=1, max_length=255, examples=["123 Main St"])
+    city: str = Field(..., min_length=1, max_length=100, examples=["Seattle"])
+    state: str = Field(..., min_length=2, max_length=50, examples=["WA"])
+    postal_code: str = Field(..., min_length=5, max_length=20, examples=["98101"])
+    country: str = Field(default="US", min_length=2, max_length=2, examples=["US"])
 
 
 class OrderItemCreate(BaseModel):
     """Schema for creating order items"""
 
-    product_id: str = Field(..., min_length=1, example="prod_123")
+    product_id: str = Field(..., min_length=1, examples=["prod_123"])
     product_name: str = Field(
-        ..., min_length=1, max_length=255, example="Premium Widget"
+        ..., min_length=1, max_length=255, examples=["Premium Widget"]
     )
-    quantity: int = Field(..., ge=1, le=1000, example=2)
-    unit_price: Decimal = Field(..., ge=0, decimal_places=2, example=29.99)
+    quantity: int = Field(..., ge=1, le=1000, examples=[2])
+    unit_price: Money = Field(..., ge=0, decimal_places=2, examples=[29.99])
 
 
 class OrderItemResponse(OrderItemCreate):
     """Schema for order item responses"""
 
-    total_price: Decimal = Field(..., ge=0, decimal_places=2, example=59.98)
+    total_price: Money = Field(..., ge=0, decimal_places=2, examples=[59.98])
 
 
 class PaymentInfoCreate(BaseModel):
     """Schema for payment information in requests"""
 
-    method: PaymentMethod = Field(..., example=PaymentMethod.CREDIT_CARD)
+    method: PaymentMethod = Field(..., examples=[PaymentMethod.CREDIT_CARD])
     last_four_digits: Optional[str] = Field(
-        None, min_length=4, max_length=4, example="1234"
+        None, min_length=4, max_length=4, examples=["1234"]
     )
 
 
 class PaymentInfoResponse(PaymentInfoCreate):
     """Schema for payment information in responses"""
 
-    status: PaymentStatus = Field(..., example=PaymentStatus.PENDING)
-    transaction_id: Optional[str] = Field(None, example="txn_abc123")
-    processor: Optional[str] = Field(None, example="stripe")
+    status: PaymentStatus = Field(..., examples=[PaymentStatus.PENDING])
+    transaction_id: Optional[str] = Field(None, examples=["txn_abc123"])
+    processor: Optional[str] = Field(None, examples=["stripe"])
 
 
 class OrderCreate(BaseModel):
     """Schema for creating new orders"""
 
-    customer_id: str = Field(..., min_length=1, example="cust_456")
-    customer_email: str = Field(
-        ..., regex=r"^[^@]+@[^@]+\.[^@]+$", example="customer@example.com"
-    )
-    items: List[OrderItemCreate] = Field(..., min_items=1, max_items=100)
+    customer_id: str = Field(..., min_length=1, examples=["cust_456"])
+    customer_email: Email = Field(..., examples=["customer@example.com"])
+    items: List[OrderItemCreate] = Field(..., min_length=1, max_length=100)
 
     billing_address: AddressSchema
     shipping_address: Optional[AddressSchema] = None
@@ -68,22 +66,22 @@ class OrderCreate(BaseModel):
     payment_info: PaymentInfoCreate
 
     tax_amount: Decimal = Field(
-        default=Decimal("0.00"), ge=0, decimal_places=2, example=5.99
+        default=Decimal("0.00"), ge=0, decimal_places=2, examples=[5.99]
     )
     shipping_amount: Decimal = Field(
-        default=Decimal("0.00"), ge=0, decimal_places=2, example=9.99
+        default=Decimal("0.00"), ge=0, decimal_places=2, examples=[9.99]
     )
     discount_amount: Decimal = Field(
-        default=Decimal("0.00"), ge=0, decimal_places=2, example=0.00
+        default=Decimal("0.00"), ge=0, decimal_places=2, examples=[0.00]
     )
 
     notes: Optional[str] = Field(
-        None, max_length=1000, example="Please handle with care"
+        None, max_length=1000, examples=["Please handle with care"]
     )
-    source: str = Field(default="api", example="web")
+    source: str = Field(default="api", examples=["web"])
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "customer_id": "cust_456",
                 "customer_email": "john.doe@example.com",
@@ -108,6 +106,7 @@ class OrderCreate(BaseModel):
                 "notes": "Express delivery requested",
             }
         }
+    )
 
 
 class OrderUpdate(BaseModel):
@@ -123,20 +122,20 @@ class OrderUpdate(BaseModel):
 class OrderResponse(BaseModel):
     """Schema for order responses"""
 
-    id: str = Field(..., example="order_789")
-    order_number: str = Field(..., example="ORD-2026-001")
-    customer_id: str = Field(..., example="cust_456")
-    customer_email: str = Field(..., example="john.doe@example.com")
+    id: str = Field(..., examples=["order_789"])
+    order_number: str = Field(..., examples=["ORD-2026-001"])
+    customer_id: str = Field(..., examples=["cust_456"])
+    customer_email: str = Field(..., examples=["john.doe@example.com"])
 
-    status: OrderStatus = Field(..., example=OrderStatus.PENDING)
+    status: OrderStatus = Field(..., examples=[OrderStatus.PENDING])
     items: List[OrderItemResponse]
 
-    subtotal: Decimal = Field(..., example=59.98)
-    tax_amount: Decimal = Field(..., example=5.99)
-    shipping_amount: Decimal = Field(..., example=9.99)
-    discount_amount: Decimal = Field(..., example=0.00)
-    total_amount: Decimal = Field(..., example=75.96)
-    currency: str = Field(..., example="USD")
+    subtotal: Money = Field(..., examples=[59.98])
+    tax_amount: Money = Field(..., examples=[5.99])
+    shipping_amount: Money = Field(..., examples=[9.99])
+    discount_amount: Money = Field(..., examples=[0.00])
+    total_amount: Money = Field(..., examples=[75.96])
+    currency: str = Field(..., examples=["USD"])
 
     billing_address: AddressSchema
     shipping_address: Optional[AddressSchema] = None
@@ -144,28 +143,63 @@ class OrderResponse(BaseModel):
     payment_info: PaymentInfoResponse
 
     notes: Optional[str] = None
-    source: str = Field(..., example="api")
+    source: str = Field(..., examples=["api"])
 
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {Decimal: lambda v: float(v), datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(use_enum_values=True)
+
+
+class OrderListItemResponse(BaseModel):
+    """Schema for order rows in list responses, without items or addresses"""
+
+    id: str = Field(..., examples=["order_789"])
+    order_number: str = Field(..., examples=["ORD-2026-001"])
+    customer_id: str = Field(..., examples=["cust_456"])
+    customer_email: str = Field(..., examples=["john.doe@example.com"])
+    status: OrderStatus = Field(..., examples=[OrderStatus.PENDING])
+    total_amount: Money = Field(..., examples=[75.96])
+    currency: str = Field(..., examples=["USD"])
+    created_at: datetime
+
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class OrderListResponse(BaseModel):
     """Schema for paginated order list responses"""
 
-    orders: List[OrderResponse]
-    total_count: int = Field(..., example=150)
-    page: int = Field(..., example=1)
-    page_size: int = Field(..., example=20)
-    total_pages: int = Field(..., example=8)
+    orders: List[OrderListItemResponse]
+    total_count: int = Field(..., examples=[150])
+    page: int = Field(..., examples=[1])
+    page_size: int = Field(..., examples=[20])
+    total_pages: int = Field(..., examples=[8])
+    continuation_token: Optional[str] = Field(
+        None, description="Token for the next page; pass it back to continue"
+    )
+
+    @classmethod
+    def paginate(
+        cls,
+        orders: List[OrderListItemResponse],
+        total_count: int,
+        page: int,
+        page_size: int,
+        continuation_token: Optional[str] = None,
+    ) -> "OrderListResponse":
+        """Build a page of already-validated orders without revalidating them"""
+        return cls.model_construct(
+            orders=orders,
+            total_count=total_count,
+            page=page,
+            page_size=page_size,
+            total_pages=(total_count + page_size - 1) // page_size,
+            continuation_token=continuation_token,
+        )
 
 
 class MessageResponse(BaseModel):
     """Schema for simple message responses"""
 
-    message: str = Field(..., example="Order created successfully")
-    order_id: Optional[str] = Field(None, example="order_789")
+    message: str = Field(..., examples=["Order created successfully"])
+    order_id: Optional[str] = Field(None, examples=["order_789"])
@@ -1,9 +1,29 @@
 """Analytics service - Business logic for order analytics and reporting"""
 
-from datetime import date, timedelta
-from decimal import Decimal
-from typing import List, Optional
+import asyncio
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Concatenate,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.models.analytics import (
     CustomerMetrics,
     DailyOrderMetrics,
@@ -19,7 +39,138 @@ from app.schemas.analytics import (
     TopCustomersResponse,
 )
 
+P = ParamSpec("P")
+T = TypeVar("T")
+ServiceT = TypeVar("ServiceT")
+
+_settings = get_settings()
+
+# Shared across service instances so repeat dashboard hits skip Cosmos
+analytics_cache = TTLCache(maxsize=_settings.analytics_cache_max_entries)
+
+# Cache misses currently being computed, keyed like analytics_cache
+_in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+# Bumped on every invalidation; a load only stores its result if no
+# invalidation happened while its query was running
+_cache_generation = 0
+
+# Streaming window sizing: start small for a fast first byte, then resize each
+# window so its query takes roughly the target time.
+STREAM_INITIAL_WINDOW_DAYS = 7
+STREAM_TARGET_WINDOW_SECONDS = 0.25
+
+# Daily rollup rows are bucketed per day and currency
+_DayCurrency = Tuple[date, str]
+
+_CENT = Decimal("0.01")
+_ZERO_AMOUNT = Decimal("0.00")
+
+# Days without orders are copies of this template with their own date
+_ZERO_DAY = DailyOrderMetrics.model_construct(
+    date=date.min,
+    order_count=0,
+    total_revenue=_ZERO_AMOUNT,
+    average_order_value=_ZERO_AMOUNT,
+    currency="USD",
+)
+
+
+def invalidate_analytics_cache() -> None:
+    """Drop cached and in-flight analytics after orders change"""
+    global _cache_generation
+    _cache_generation += 1
+    analytics_cache.clear()
+    _in_flight.clear()
+
+
+def _cache_ttl(end_date: date) -> int:
+    """Closed historical ranges rarely change; ranges including today do"""
+    # Orders are stamped with UTC timestamps, so "today" is the UTC date
+    if end_date < datetime.utcnow().date():
+        return _settings.analytics_historical_cache_ttl
+    return _settings.analytics_cache_ttl
+
+
+def _average(total: Decimal, count: int) -> Decimal:
+    """Average order value rounded to cents"""
+    if not count:
+        return _ZERO_AMOUNT
+    return (total / count).quantize(_CENT, rounding=ROUND_HALF_UP)
 
+
+def _growth_rate(current: Decimal, previous: Optional[Decimal]) -> Optional[float]:
+    """Percentage change from previous to current, if previous had revenue"""
+    if previous is None or previous <= 0:
+        return None
+    return round(float((current - previous) / previous * 100), 2)
+
+
+def _previous_period(current_period: AnalyticsDateRange) -> Tuple[date, date]:
+    """Bounds of the equally long period just before current_period"""
+    period_length = (current_period.end_date - current_period.start_date).days + 1
+    previous_end = current_period.start_date - timedelta(days=1)
+    return previous_end - timedelta(days=period_length - 1), previous_end
+
+
+def cached_by_date_range(
+    method: Callable[Concatenate[ServiceT, AnalyticsDateRange, P], Awaitable[T]]
+) -> Callable[Concatenate[ServiceT, AnalyticsDateRange, P], Awaitable[T]]:
+    """Cache an analytics method keyed by its date range and extra arguments
+
+    Concurrent misses for the same key share one in-flight computation, so a
+    burst of dashboard requests triggers a single scan of the window.
+    """
+
+    async def load(
+        self: ServiceT,
+        key: Hashable,
+        date_range: AnalyticsDateRange,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        generation = _cache_generation
+        try:
+            result = await method(self, date_range, *args, **kwargs)
+            if generation == _cache_generation:
+                analytics_cache.set(key, result, _cache_ttl(date_range.end_date))
+            return result
+        finally:
+            # After an invalidation the key may belong to a newer load
+            if _in_flight.get(key) is asyncio.current_task():
+                del _in_flight[key]
+
+    @wraps(method)
+    async def wrapper(
+        self: ServiceT,
+        date_range: AnalyticsDateRange,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        key = (
+            method.__name__,
+            date_range.start_date,
+            date_range.end_date,
+            *args,
+            *sorted(kwargs.items()),
+        )
+        cached = analytics_cache.get(key)
+        if cached is not None:
+            return cast(T, cached)
+
+        task = _in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load(self, key, date_range, *args, **kwargs))
+            _in_flight[key] = task
+        # Shielded so one cancelled caller does not cancel the shared load
+        return cast(T, await asyncio.shield(task))
+
+    return wrapper
+
+
+# Results are assembled from repository rows that were validated when read, so
+# metric and response models are built with model_construct; FastAPI still
+# checks the returned value against each route's response_model.
 class AnalyticsService:
     """Service for generating order analytics and metrics"""
 
@@ -30,31 +181,18 @@ class AnalyticsService:
         self, daily_metrics: List[DailyOrderMetrics], start_date: date, end_date: date
     ) -> List[DailyOrderMetrics]:
         """Fill in missing days with zero metrics"""
-        # Create a map of existing metrics by date
         metrics_by_date = {metric.date: metric for metric in daily_metrics}
+        days = (
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        )
 
-        # Generate complete date range
-        complete_metrics = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            if current_date in metrics_by_date:
-                complete_metrics.append(metrics_by_date[current_date])
-            else:
-                # Create zero metric for missing day
-                zero_metric = DailyOrderMetrics(
-                    date=current_date,
-                    order_count=0,
-                    total_revenue=Decimal("0.00"),
-                    average_order_value=Decimal("0.00"),
-                    currency="USD",
-                )
-                complete_metrics.append(zero_metric)
-
-            current_date += timedelta(days=1)
-
-        return complete_metrics
+        return [
+            metrics_by_date.get(day) or _ZERO_DAY.model_copy(update={"date": day})
+            for day in days
+        ]
 
+    @cached_by_date_range
     async def get_daily_analytics(
         self, date_range: AnalyticsDateRange
     ) -> DailyAnalyticsResponse:
@@ -77,7 +215,7 @@ class AnalyticsService:
                 )
             )
 
-            period_summary = RevenueMetrics(
+            period_summary = RevenueMetrics.model_construct(
                 period_start=date_range.start_date,
                 period_end=date_range.end_date,
                 total_revenue=total_revenue,
@@ -89,7 +227,7 @@ class AnalyticsService:
             # Calculate total days
             total_days = (date_range.end_date - date_range.start_date).days + 1
 
-            return DailyAnalyticsResponse(
+            return DailyAnalyticsResponse.model_construct(
                 metrics=complete_metrics,
                 period_summary=period_summary,
                 total_days=total_days,
@@ -98,21 +236,21 @@ class AnalyticsService:
         except Exception as e:
             raise RuntimeError(f"Failed to get daily analytics: {str(e)}")
 
+    @cached_by_date_range
     async def get_order_status_analytics(
         self, date_range: AnalyticsDateRange
     ) -> OrderStatusAnalyticsResponse:
         """Get order analytics grouped by status"""
         try:
-            # Get status metrics
-            status_metrics = await self.order_repository.get_order_status_metrics(
+            (
+                status_metrics,
+                total_orders,
+                total_revenue,
+            ) = await self.order_repository.get_order_status_metrics(
                 date_range.start_date, date_range.end_date
             )
 
-            # Calculate totals
-            total_orders = sum(metric.count for metric in status_metrics)
-            total_revenue = sum(metric.total_value for metric in status_metrics)
-
-            return OrderStatusAnalyticsResponse(
+            return OrderStatusAnalyticsResponse.model_construct(
                 status_metrics=status_metrics,
                 period=date_range,
                 total_orders=total_orders,
@@ -122,6 +260,7 @@ class AnalyticsService:
         except Exception as e:
             raise RuntimeError(f"Failed to get order status analytics: {str(e)}")
 
+    @cached_by_date_range
     async def get_top_customers(
         self, date_range: AnalyticsDateRange, limit: int = 10
     ) -> TopCustomersResponse:
@@ -131,87 +270,113 @@ class AnalyticsService:
                 date_range.start_date, date_range.end_date, limit
             )
 
-            return TopCustomersResponse(
+            return TopCustomersResponse.model_construct(
                 customers=customer_metrics, period=date_range, limit=limit
             )
 
         except Exception as e:
             raise RuntimeError(f"Failed to get top customers: {str(e)}")
 
+    @cached_by_date_range
     async def get_analytics_summary(
         self, date_range: AnalyticsDateRange
     ) -> AnalyticsSummaryResponse:
         """Get comprehensive analytics summary"""
         try:
-            # Get all analytics components
-            daily_analytics = await self.get_daily_analytics(date_range)
-            status_analytics = await self.get_order_status_analytics(date_range)
-            top_customers = await self.get_top_customers(date_range, limit=5)
-
-            # Get additional insights
-            busiest_day_result = await self.order_repository.get_busiest_day(
-                date_range.start_date, date_range.end_date
-            )
-
-            highest_revenue_day_result = (
-                await self.order_repository.get_highest_revenue_day(
+            # One grouped scan per day, status and currency yields the daily
+            # trend, status breakdown, revenue totals and peak days; only the
+            # customer ranking and the previous period need their own queries.
+            rollup, top_customers, previous_revenue = await asyncio.gather(
+                self.order_repository.get_daily_status_rollup(
                     date_range.start_date, date_range.end_date
-                )
+                ),
+                self.get_top_customers(date_range, limit=5),
+                self._previous_period_revenue(date_range),
             )
 
-            # Calculate growth rate (compare to previous period)
-            growth_rate = await self._calculate_growth_rate(date_range)
+            orders_by_day_currency: Dict[_DayCurrency, int] = defaultdict(int)
+            revenue_by_day_currency: Dict[_DayCurrency, Decimal] = defaultdict(Decimal)
+            orders_by_day: Dict[date, int] = defaultdict(int)
+            revenue_by_day: Dict[date, Decimal] = defaultdict(Decimal)
+            orders_by_status: Dict[str, int] = defaultdict(int)
+            revenue_by_status: Dict[str, Decimal] = defaultdict(Decimal)
+            for day, status, currency, order_count, revenue in rollup:
+                orders_by_day_currency[day, currency] += order_count
+                revenue_by_day_currency[day, currency] += revenue
+                orders_by_day[day] += order_count
+                revenue_by_day[day] += revenue
+                orders_by_status[status] += order_count
+                revenue_by_status[status] += revenue
+
+            daily_metrics = [
+                DailyOrderMetrics.model_construct(
+                    date=day,
+                    order_count=order_count,
+                    total_revenue=revenue_by_day_currency[day, currency],
+                    average_order_value=_average(
+                        revenue_by_day_currency[day, currency], order_count
+                    ),
+                    currency=currency,
+                )
+                for (day, currency), order_count in sorted(
+                    orders_by_day_currency.items()
+                )
+            ]
+
+            total_orders = sum(orders_by_status.values())
+            total_revenue = sum(revenue_by_status.values(), _ZERO_AMOUNT)
+            status_metrics = [
+                OrderStatusMetrics.model_construct(
+                    status=status,
+                    count=count,
+                    total_value=revenue_by_status[status],
+                    percentage=round(count / total_orders * 100, 2),
+                )
+                for status, count in sorted(
+                    orders_by_status.items(), key=lambda item: item[1], reverse=True
+                )
+            ]
 
-            return AnalyticsSummaryResponse(
+            return AnalyticsSummaryResponse.model_construct(
                 period=date_range,
-                revenue_metrics=daily_analytics.period_summary,
-                status_breakdown=status_analytics.status_metrics,
-                daily_trend=daily_analytics.metrics,
+                revenue_metrics=RevenueMetrics.model_construct(
+                    period_start=date_range.start_date,
+                    period_end=date_range.end_date,
+                    total_revenue=total_revenue,
+                    total_orders=total_orders,
+                    average_order_value=_average(total_revenue, total_orders),
+                    currency="USD",
+                ),
+                status_breakdown=status_metrics,
+                daily_trend=self._fill_missing_days(
+                    daily_metrics, date_range.start_date, date_range.end_date
+                ),
                 top_customers=top_customers.customers,
-                growth_rate=growth_rate,
-                busiest_day=busiest_day_result[0] if busiest_day_result else None,
-                highest_revenue_day=(
-                    highest_revenue_day_result[0]
-                    if highest_revenue_day_result
-                    else None
+                growth_rate=_growth_rate(total_revenue, previous_revenue),
+                busiest_day=max(
+                    orders_by_day, key=lambda day: orders_by_day[day], default=None
+                ),
+                highest_revenue_day=max(
+                    revenue_by_day, key=lambda day: revenue_by_day[day], default=None
                 ),
             )
 
         except Exception as e:
             raise RuntimeError(f"Failed to get analytics summary: {str(e)}")
 
-    async def _calculate_growth_rate(
+    async def _previous_period_revenue(
         self, current_period: AnalyticsDateRange
-    ) -> Optional[float]:
-        """Calculate revenue growth rate compared to previous period"""
+    ) -> Optional[Decimal]:
+        """Get revenue for the equally long period just before current_period"""
         try:
-            # Calculate previous period (same length as current period)
-            period_length = (
-                current_period.end_date - current_period.start_date
-            ).days + 1
-            previous_end = current_period.start_date - timedelta(days=1)
-            previous_start = previous_end - timedelta(days=period_length - 1)
-
-            # Get revenue for both periods
-            current_revenue, _, _ = await self.order_repository.get_revenue_summary(
-                current_period.start_date, current_period.end_date
-            )
-
+            previous_start, previous_end = _previous_period(current_period)
             previous_revenue, _, _ = await self.order_repository.get_revenue_summary(
                 previous_start, previous_end
             )
-
-            # Calculate growth rate
-            if previous_revenue > 0:
-                growth_rate = (
-                    (current_revenue - previous_revenue) / previous_revenue
-                ) * 100
-                return round(float(growth_rate), 2)
-
-            return None
+            return previous_revenue
 
         except Exception:
-            # Return None if we can't calculate growth rate
+            # Growth rate is optional; treat a failed lookup as no data
             return None
 
     async def get_revenue_trends(self, days: int = 30) -> DailyAnalyticsResponse:
@@ -222,6 +387,43 @@ class AnalyticsService:
         date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
         return await self.get_daily_analytics(date_range)
 
+    async def stream_revenue_trends(
+        self, days: int = 30
+    ) -> AsyncIterator[DailyOrderMetrics]:
+        """Stream daily metrics for the last N days, oldest first"""
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days - 1)
+
+        async for metric in self._iter_daily_metrics(start_date, end_date):
+            yield metric
+
+    async def _iter_daily_metrics(
+        self, start_date: date, end_date: date
+    ) -> AsyncIterator[DailyOrderMetrics]:
+        """Query daily metrics in adaptively sized windows across a date range"""
+        window_days = STREAM_INITIAL_WINDOW_DAYS
+        window_start = start_date
+
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=window_days - 1), end_date)
+
+            started = time.perf_counter()
+            daily_metrics = await self.order_repository.get_daily_metrics(
+                window_start, window_end
+            )
+            elapsed = time.perf_counter() - started
+
+            for metric in self._fill_missing_days(
+                daily_metrics, window_start, window_end
+            ):
+                yield metric
+
+            # Daily buckets are independent, so windows can be resized freely;
+            # limit each step to halving or doubling to damp latency noise.
+            scale = STREAM_TARGET_WINDOW_SECONDS / max(elapsed, 0.001)
+            window_days = max(1, int(window_days * min(max(scale, 0.5), 2.0)))
+            window_start = window_end + timedelta(days=1)
+
     async def get_customer_analytics(
         self, customer_id: str, date_range: Optional[AnalyticsDateRange] = None
     ) -> CustomerMetrics:
@@ -233,24 +435,19 @@ class AnalyticsService:
             date_range = AnalyticsDateRange(start_date=start_date, end_date=end_date)
 
         try:
-            customer_metrics = await self.order_repository.get_customer_metrics(
-                date_range.start_date,
-                date_range.end_date,
-                limit=1000,  # Large limit to get all orders
+            customer_metrics = await self.order_repository.get_metrics_for_customer(
+                customer_id, date_range.start_date, date_range.end_date
             )
-
-            # Find the specific customer
-            for metric in customer_metrics:
-                if metric.customer_id == customer_id:
-                    return metric
+            if customer_metrics:
+                return customer_metrics
 
             # If customer not found, return empty metrics
-            return CustomerMetrics(
+            return CustomerMetrics.model_construct(
                 customer_id=customer_id,
                 customer_email="",
                 total_orders=0,
-                total_spent=Decimal("0.00"),
-                average_order_value=Decimal("0.00"),
+                total_spent=_ZERO_AMOUNT,
+                average_order_value=_ZERO_AMOUNT,
                 first_order_date=None,
                 last_order_date=None,
             )
@@ -261,7 +458,9 @@ class AnalyticsService:
             )
 
 
-# Dependency for FastAPI
+# Dependency for FastAPI; the service holds no per-request state, so one
+# instance is shared by every request
+@lru_cache()
 def get_analytics_service() -> AnalyticsService:
-    """FastAPI dependency to get analytics service instance"""
+    """FastAPI dependency to get the shared analytics service instance"""
     return AnalyticsService()
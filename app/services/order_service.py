@@ -1,14 +1,57 @@
 """Order service - Business logic layer for order management"""
 
-import uuid
+import asyncio
+import logging
+import os
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from functools import lru_cache
+from typing import Awaitable, List, Optional
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.models.base import OrderStatus, PaymentStatus
-from app.models.order import Address, Order, OrderItem, PaymentInfo
+from app.models.order import Address, Order, OrderItem, OrderSummary, PaymentInfo
 from app.repositories.order_repository import OrderRepository
-from app.schemas.order import OrderCreate, OrderUpdate
+from app.schemas.order import OrderCreate, OrderItemCreate, OrderUpdate
+from app.services.analytics_service import invalidate_analytics_cache
+
+_settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# Totals for paginated listings, keyed by (customer filter, status filter)
+order_count_cache = TTLCache()
+
+
+def _forget_order_counts(customer_id: str) -> None:
+    """Drop cached totals that include the customer's orders"""
+    for scope in (customer_id, None):
+        for status in (None, *OrderStatus):
+            order_count_cache.delete((scope, status))
+
+
+# Caps concurrent side-effect calls across all in-flight orders
+_side_effect_slots = asyncio.Semaphore(_settings.order_side_effect_concurrency)
+
+
+async def _bounded(step: Awaitable[None]) -> None:
+    """Await step once a side-effect slot is free"""
+    async with _side_effect_slots:
+        await step
+
+
+# Formatted date of the most recent order number, keyed by day ordinal
+_order_date: tuple[int, str] = (0, "")
+
+
+def _order_date_prefix(now: datetime) -> str:
+    """Format now as YYYYMMDD, reusing the string for the rest of the day"""
+    global _order_date
+    day = now.toordinal()
+    if day != _order_date[0]:
+        _order_date = (day, now.strftime("%Y%m%d"))
+    return _order_date[1]
 
 
 class OrderService:
@@ -17,10 +60,10 @@ class OrderService:
     def __init__(self):
         self.order_repository = OrderRepository()
 
-    def _generate_order_number(self) -> str:
+    def _generate_order_number(self, now: Optional[datetime] = None) -> str:
         """Generate a unique order number"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d")
-        random_suffix = str(uuid.uuid4())[:8].upper()
+        timestamp = _order_date_prefix(now or datetime.utcnow())
+        random_suffix = os.urandom(4).hex().upper()
         return f"ORD-{timestamp}-{random_suffix}"
 
     def _calculate_order_totals(
@@ -35,38 +78,24 @@ class OrderService:
         total_amount = subtotal + tax_amount + shipping_amount - discount_amount
         return subtotal, total_amount
 
-    def _create_order_items_from_schema(
-        self, items_data: List[dict]
-    ) -> List[OrderItem]:
-        """Convert order item schema data to OrderItem models"""
-        order_items = []
-        for item_data in items_data:
-            total_price = item_data["quantity"] * item_data["unit_price"]
-            order_item = OrderItem(
-                product_id=item_data["product_id"],
-                product_name=item_data["product_name"],
-                quantity=item_data["quantity"],
-                unit_price=item_data["unit_price"],
-                total_price=total_price,
+    def _build_order_items(self, items_data: List[OrderItemCreate]) -> List[OrderItem]:
+        """Convert order item schemas to OrderItem models"""
+        return [
+            OrderItem(
+                product_id=item_data.product_id,
+                product_name=item_data.product_name,
+                quantity=item_data.quantity,
+                unit_price=item_data.unit_price,
+                total_price=item_data.quantity * item_data.unit_price,
             )
-            order_items.append(order_item)
-        return order_items
+            for item_data in items_data
+        ]
 
     async def create_order(self, order_data: OrderCreate) -> Order:
         """Create a new order"""
         try:
             # Convert items data to OrderItem models
-            order_items = []
-            for item_data in order_data.items:
-                total_price = item_data.quantity * item_data.unit_price
-                order_item = OrderItem(
-                    product_id=item_data.product_id,
-                    product_name=item_data.product_name,
-                    quantity=item_data.quantity,
-                    unit_price=item_data.unit_price,
-                    total_price=total_price,
-                )
-                order_items.append(order_item)
+            order_items = self._build_order_items(order_data.items)
 
             # Calculate totals
             subtotal, total_amount = self._calculate_order_totals(
@@ -76,25 +105,31 @@ class OrderService:
                 order_data.discount_amount,
             )
 
-            # Create addresses
-            billing_address = Address(**order_data.billing_address.dict())
+            # Create addresses; the request schema has already validated them
+            # against the same constraints, so they are not validated twice
+            billing_address = Address.model_construct(
+                **order_data.billing_address.__dict__
+            )
             shipping_address = None
             if order_data.shipping_address:
-                shipping_address = Address(**order_data.shipping_address.dict())
+                shipping_address = Address.model_construct(
+                    **order_data.shipping_address.__dict__
+                )
             else:
                 # Use billing address as shipping address if not provided
                 shipping_address = billing_address
 
             # Create payment info
-            payment_info = PaymentInfo(
+            payment_info = PaymentInfo.model_construct(
                 method=order_data.payment_info.method,
                 status=PaymentStatus.PENDING,
                 last_four_digits=order_data.payment_info.last_four_digits,
             )
 
-            # Create order
+            # Create order; one clock read stamps both the number and created_at
+            now = datetime.utcnow()
             order = Order(
-                order_number=self._generate_order_number(),
+                order_number=self._generate_order_number(now),
                 customer_id=order_data.customer_id,
                 customer_email=order_data.customer_email,
                 partition_key=order_data.customer_id,  # Use customer_id as partition key
@@ -110,14 +145,15 @@ class OrderService:
                 payment_info=payment_info,
                 notes=order_data.notes,
                 source=order_data.source,
-                created_at=datetime.utcnow(),
+                created_at=now,
             )
 
             # Save to repository
             created_order = await self.order_repository.create(order)
+            _forget_order_counts(created_order.customer_id)
 
-            # In a real system, you would trigger payment processing,
-            # inventory reservation, and send notifications here
+            # Side effects run only once the order is persisted, so each of
+            # them sees the stored order id
             await self._process_order_async(created_order)
 
             return created_order
@@ -146,11 +182,11 @@ class OrderService:
                 return None
 
             # Update fields
-            update_dict = update_data.dict(exclude_unset=True)
+            update_dict = update_data.model_dump(exclude_unset=True)
 
             for field, value in update_dict.items():
                 if field == "shipping_address" and value:
-                    setattr(existing_order, field, Address(**value))
+                    setattr(existing_order, field, Address.model_construct(**value))
                 else:
                     setattr(existing_order, field, value)
 
@@ -158,9 +194,13 @@ class OrderService:
 
             # Save changes
             updated_order = await self.order_repository.update(existing_order)
+            # Updates can change analytics for closed ranges, which are cached
+            # for a long time; drop them so the next read reflects this write
+            invalidate_analytics_cache()
 
             # Trigger status change processing if needed
             if "status" in update_dict:
+                _forget_order_counts(customer_id)
                 await self._handle_status_change(updated_order, update_dict["status"])
 
             return updated_order
@@ -187,6 +227,8 @@ class OrderService:
             existing_order.updated_at = datetime.utcnow()
 
             updated_order = await self.order_repository.update(existing_order)
+            invalidate_analytics_cache()
+            _forget_order_counts(customer_id)
 
             # In a real system, you would:
             # - Refund payment if captured
@@ -201,7 +243,11 @@ class OrderService:
 
     async def delete_order(self, order_id: str, customer_id: str) -> bool:
         """Delete an order (admin operation)"""
-        return await self.order_repository.delete(order_id, customer_id)
+        deleted = await self.order_repository.delete(order_id, customer_id)
+        if deleted:
+            invalidate_analytics_cache()
+            _forget_order_counts(customer_id)
+        return deleted
 
     async def list_orders(
         self,
@@ -209,46 +255,123 @@ class OrderService:
         status: Optional[OrderStatus] = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[List[Order], int]:
-        """List orders with pagination"""
+        continuation_token: Optional[str] = None,
+    ) -> tuple[List[OrderSummary], int, Optional[str]]:
+        """List order headers with pagination
+
+        Listings read only the header fields of each order; fetch a single
+        order for its items, addresses and payment details. Within a customer's
+        partition, the first page and any page requested with a continuation
+        token are read with seek pagination and return the token for the next
+        page. Cross-partition listings and other page numbers use OFFSET paging,
+        since a cross-partition ORDER BY has no resumable token.
+        """
         try:
             offset = (page - 1) * page_size
-
             if status:
-                orders = await self.order_repository.get_orders_by_status(
-                    status, customer_id, page_size
+                page_query = self._without_token(
+                    self.order_repository.get_orders_by_status_summary(
+                        status, customer_id, page_size, offset
+                    )
+                )
+            elif customer_id and (continuation_token or page == 1):
+                page_query = self.order_repository.list_items_summary_page(
+                    customer_id, page_size, continuation_token
                 )
             else:
-                orders = await self.order_repository.list_items(
-                    customer_id, page_size, offset
+                page_query = self._without_token(
+                    self.order_repository.list_items_summary(
+                        customer_id, page_size, offset
+                    )
                 )
 
-            total_count = await self.order_repository.count_orders(customer_id)
+            # The page and its total are independent queries; run them together
+            (orders, next_token), total_count = await asyncio.gather(
+                page_query, self._count_orders(customer_id, status)
+            )
 
-            return orders, total_count
+            return orders, total_count, next_token
 
         except Exception as e:
             raise RuntimeError(f"Failed to list orders: {str(e)}")
 
+    @staticmethod
+    async def _without_token(
+        page_query: Awaitable[List[OrderSummary]],
+    ) -> tuple[List[OrderSummary], Optional[str]]:
+        """Adapt an OFFSET-paged query to the (orders, next token) shape"""
+        return await page_query, None
+
+    async def _count_orders(
+        self, customer_id: Optional[str], status: Optional[OrderStatus]
+    ) -> int:
+        """Count orders, reusing a recent total for the same filters"""
+        key = (customer_id, status)
+        total_count = order_count_cache.get(key)
+        if total_count is None:
+            total_count = await self.order_repository.count_orders(customer_id, status)
+            order_count_cache.set(key, total_count, _settings.order_count_cache_ttl)
+        return total_count
+
     async def get_customer_orders(
-        self, customer_id: str, page: int = 1, page_size: int = 20
-    ) -> tuple[List[Order], int]:
+        self,
+        customer_id: str,
+        page: int = 1,
+        page_size: int = 20,
+        continuation_token: Optional[str] = None,
+    ) -> tuple[List[OrderSummary], int, Optional[str]]:
         """Get all orders for a specific customer"""
         return await self.list_orders(
-            customer_id=customer_id, page=page, page_size=page_size
+            customer_id=customer_id,
+            page=page,
+            page_size=page_size,
+            continuation_token=continuation_token,
         )
 
     async def _process_order_async(self, order: Order) -> None:
-        """Async order processing (placeholder for real implementations)"""
-        # In a real system, this would:
-        # 1. Validate inventory availability
-        # 2. Reserve inventory
-        # 3. Process payment authorization
-        # 4. Send order confirmation email
-        # 5. Update order status to CONFIRMED
+        """Run the independent post-persist steps concurrently"""
+        # In a real system, this would also validate inventory availability
+        # and update the order status to CONFIRMED
+        reserved, authorized, confirmed = await asyncio.gather(
+            _bounded(self._reserve_inventory(order)),
+            _bounded(self._authorize_payment(order)),
+            _bounded(self._send_order_confirmation(order)),
+            return_exceptions=True,
+        )
+
+        for step, result in (
+            ("inventory reservation", reserved),
+            ("payment authorization", authorized),
+            ("order confirmation", confirmed),
+        ):
+            if isinstance(result, Exception):
+                logger.error(
+                    "%s failed for order %s: %s", step, order.order_number, result
+                )
+
+        # Compensate partial failures: stock held for an unpaid order is released
+        if isinstance(authorized, Exception) and not isinstance(reserved, Exception):
+            await _bounded(self._release_inventory(order))
+
+    async def _reserve_inventory(self, order: Order) -> None:
+        """Reserve stock for the order items (placeholder)"""
+        logger.info("Reserving inventory for order %s", order.order_number)
+
+    async def _release_inventory(self, order: Order) -> None:
+        """Release stock reserved for the order (placeholder)"""
+        logger.info("Releasing inventory for order %s", order.order_number)
+
+    async def _authorize_payment(self, order: Order) -> None:
+        """Authorize the order payment (placeholder)"""
+        logger.info(
+            "Authorizing payment for order %s for customer %s",
+            order.order_number,
+            order.customer_id,
+        )
 
-        # For demo purposes, just log
-        print(f"Processing order {order.order_number} for customer {order.customer_id}")
+    async def _send_order_confirmation(self, order: Order) -> None:
+        """Send the order confirmation email (placeholder)"""
+        logger.info("Sending confirmation for order %s", order.order_number)
 
     async def _handle_status_change(
         self, order: Order, new_status: OrderStatus
@@ -276,7 +399,9 @@ class OrderService:
         print(f"Order {order.order_number} cancelled")
 
 
-# Dependency for FastAPI
+# Dependency for FastAPI; the service holds no per-request state, so one
+# instance is shared by every request
+@lru_cache()
 def get_order_service() -> OrderService:
-    """FastAPI dependency to get order service instance"""
+    """FastAPI dependency to get the shared order service instance"""
     return OrderService()
@@ -9,10 +9,10 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from app.models.base import OrderStatus, PaymentMethod, PaymentStatus
-from app.models.order import Address, Order, OrderItem, PaymentInfo
+from app.models.order import Address, Order, OrderItem, OrderSummary, PaymentInfo
 from app.repositories.order_repository import OrderRepository
-from app.services.analytics_service import AnalyticsService
-from app.services.order_service import OrderService
+from app.services.analytics_service import AnalyticsService, analytics_cache
+from app.services.order_service import OrderService, order_count_cache
 
 
 @pytest.fixture(scope="session")
@@ -23,7 +23,17 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """Reset the shared service caches so tests stay isolated"""
+    analytics_cache.clear()
+    order_count_cache.clear()
+    yield
+    analytics_cache.clear()
+    order_count_cache.clear()
+
+
+@pytest.fixture(scope="session")
 def sample_address() -> Address:
     """Fixture for sample address data"""
     return Address(
@@ -35,7 +45,7 @@ def sample_address() -> Address:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order_items() -> list[OrderItem]:
     """Fixture for sample order items"""
     return [
@@ -56,7 +66,7 @@ def sample_order_items() -> list[OrderItem]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_payment_info() -> PaymentInfo:
     """Fixture for sample payment information"""
     return PaymentInfo(
@@ -66,6 +76,7 @@ def sample_payment_info() -> PaymentInfo:
     )
 
 
+# Orders are mutated by the update and cancel tests, so each test gets its own
 @pytest.fixture
 def sample_order(sample_address, sample_order_items, sample_payment_info) -> Order:
     """Fixture for sample order"""
@@ -92,6 +103,12 @@ def sample_order(sample_address, sample_order_items, sample_payment_info) -> Ord
     )
 
 
+@pytest.fixture
+def sample_order_summary(sample_order) -> OrderSummary:
+    """Fixture for the list-view header of the sample order"""
+    return OrderSummary.model_validate(sample_order.model_dump(by_alias=True))
+
+
 @pytest.fixture
 def mock_order_repository() -> Mock:
     """Mock order repository for testing"""
@@ -103,7 +120,9 @@ def mock_order_repository() -> Mock:
     mock_repo.update = AsyncMock()
     mock_repo.delete = AsyncMock()
     mock_repo.list_items = AsyncMock()
-    mock_repo.get_orders_by_status = AsyncMock()
+    mock_repo.list_items_summary = AsyncMock()
+    mock_repo.list_items_summary_page = AsyncMock()
+    mock_repo.get_orders_by_status_summary = AsyncMock()
     mock_repo.count_orders = AsyncMock()
     mock_repo.get_order_by_number = AsyncMock()
 
@@ -111,9 +130,9 @@ def mock_order_repository() -> Mock:
     mock_repo.get_daily_metrics = AsyncMock()
     mock_repo.get_order_status_metrics = AsyncMock()
     mock_repo.get_customer_metrics = AsyncMock()
+    mock_repo.get_metrics_for_customer = AsyncMock()
     mock_repo.get_revenue_summary = AsyncMock()
-    mock_repo.get_busiest_day = AsyncMock()
-    mock_repo.get_highest_revenue_day = AsyncMock()
+    mock_repo.get_daily_status_rollup = AsyncMock()
 
     return mock_repo
 
@@ -2,13 +2,15 @@
 
 from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.models.analytics import DailyOrderMetrics, RevenueMetrics
+from app.models.analytics import DailyOrderMetrics, OrderStatusMetrics, RevenueMetrics
+from app.schemas.analytics import AnalyticsDateRange, OrderStatusAnalyticsResponse
+from app.services.analytics_service import get_analytics_service
 
 
 class TestAnalyticsAPI:
@@ -22,10 +24,10 @@ class TestAnalyticsAPI:
     @pytest.fixture
     def mock_analytics_service(self):
         """Mock analytics service"""
-        with patch("app.api.v1.endpoints.analytics.get_analytics_service") as mock:
-            service_mock = AsyncMock()
-            mock.return_value = service_mock
-            yield service_mock
+        service_mock = AsyncMock()
+        app.dependency_overrides[get_analytics_service] = lambda: service_mock
+        yield service_mock
+        app.dependency_overrides.pop(get_analytics_service, None)
 
     def test_get_daily_analytics_success(self, client, mock_analytics_service):
         """Test successful daily analytics endpoint"""
@@ -141,6 +143,81 @@ class TestAnalyticsAPI:
         assert response.status_code == 400
         assert "End date cannot be in the future" in response.json()["detail"]
 
+    def test_get_order_status_analytics_future_date(
+        self, client, mock_analytics_service
+    ):
+        """Test order status analytics rejects a future end date"""
+        # Arrange
+        future_date = date.today() + timedelta(days=1)
+
+        # Act
+        response = client.get(
+            "/api/v1/analytics/orders/status",
+            params={"end_date": future_date.isoformat()},
+        )
+
+        # Assert
+        assert response.status_code == 400
+        assert "End date cannot be in the future" in response.json()["detail"]
+
+    def test_get_order_status_analytics_historical_not_modified(
+        self, client, mock_analytics_service
+    ):
+        """Test closed ranges answer conditional requests with 304 until they change"""
+        # Arrange
+        end_date = date.today() - timedelta(days=1)
+        start_date = end_date - timedelta(days=6)
+        params = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        }
+        period = AnalyticsDateRange(start_date=start_date, end_date=end_date)
+        mock_analytics_service.get_order_status_analytics.return_value = (
+            OrderStatusAnalyticsResponse(
+                status_metrics=[], period=period, total_orders=0, total_revenue=0
+            )
+        )
+
+        # Act
+        first = client.get("/api/v1/analytics/orders/status", params=params)
+        etag = first.headers["ETag"]
+        unchanged = client.get(
+            "/api/v1/analytics/orders/status",
+            params=params,
+            headers={"If-None-Match": etag},
+        )
+        mock_analytics_service.get_order_status_analytics.return_value = (
+            OrderStatusAnalyticsResponse(
+                status_metrics=[
+                    OrderStatusMetrics(
+                        status="cancelled",
+                        count=1,
+                        total_value=Decimal("50.00"),
+                        percentage=100.0,
+                    )
+                ],
+                period=period,
+                total_orders=1,
+                total_revenue=Decimal("50.00"),
+            )
+        )
+        changed = client.get(
+            "/api/v1/analytics/orders/status",
+            params=params,
+            headers={"If-None-Match": etag},
+        )
+
+        # Assert
+        assert first.status_code == 200
+        assert first.json()["total_orders"] == 0
+        assert etag.startswith('W/"')
+        assert "immutable" not in first.headers["Cache-Control"]
+        assert unchanged.status_code == 304
+        assert unchanged.headers["ETag"] == etag
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["total_orders"] == 1
+
     def test_get_order_status_analytics_success(self, client, mock_analytics_service):
         """Test successful order status analytics endpoint"""
         # Arrange
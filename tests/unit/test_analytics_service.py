@@ -1,5 +1,6 @@
 """Unit tests for AnalyticsService"""
 
+import asyncio
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
@@ -14,7 +15,11 @@ from app.models.analytics import (
 )
 from app.repositories.order_repository import OrderRepository
 from app.schemas.analytics import AnalyticsDateRange
-from app.services.analytics_service import AnalyticsService
+from app.services.analytics_service import (
+    AnalyticsService,
+    _growth_rate,
+    invalidate_analytics_cache,
+)
 
 
 class TestAnalyticsService:
@@ -139,6 +144,105 @@ class TestAnalyticsService:
             sample_date_range.start_date, sample_date_range.end_date
         )
 
+    @pytest.mark.asyncio
+    async def test_get_daily_analytics_cached_for_repeat_range(
+        self,
+        analytics_service_with_mock_repo,
+        mock_order_repository,
+        sample_date_range,
+        sample_daily_metrics,
+    ):
+        """Test repeated daily analytics requests are served from cache"""
+        # Arrange
+        mock_order_repository.get_daily_metrics.return_value = sample_daily_metrics
+        mock_order_repository.get_revenue_summary.return_value = (
+            Decimal("400.00"),
+            8,
+            Decimal("50.00"),
+        )
+
+        # Act
+        first = await analytics_service_with_mock_repo.get_daily_analytics(
+            sample_date_range
+        )
+        second = await analytics_service_with_mock_repo.get_daily_analytics(
+            sample_date_range
+        )
+
+        # Assert
+        assert second is first
+        mock_order_repository.get_daily_metrics.assert_called_once()
+        mock_order_repository.get_revenue_summary.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_daily_analytics_concurrent_misses_share_one_query(
+        self,
+        analytics_service_with_mock_repo,
+        mock_order_repository,
+        sample_date_range,
+        sample_daily_metrics,
+    ):
+        """Test concurrent requests for an uncached range run the queries once"""
+
+        # Arrange
+        async def slow_daily_metrics(start_date, end_date):
+            await asyncio.sleep(0.01)
+            return sample_daily_metrics
+
+        mock_order_repository.get_daily_metrics.side_effect = slow_daily_metrics
+        mock_order_repository.get_revenue_summary.return_value = (
+            Decimal("400.00"),
+            8,
+            Decimal("50.00"),
+        )
+
+        # Act
+        results = await asyncio.gather(
+            *(
+                analytics_service_with_mock_repo.get_daily_analytics(sample_date_range)
+                for _ in range(5)
+            )
+        )
+
+        # Assert
+        assert all(result is results[0] for result in results)
+        mock_order_repository.get_daily_metrics.assert_called_once()
+        mock_order_repository.get_revenue_summary.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_daily_analytics_invalidated_load_not_cached(
+        self,
+        analytics_service_with_mock_repo,
+        mock_order_repository,
+        sample_date_range,
+        sample_daily_metrics,
+    ):
+        """Test a load racing an invalidation does not repopulate the cache"""
+
+        # Arrange
+        async def slow_daily_metrics(start_date, end_date):
+            await asyncio.sleep(0.01)
+            return sample_daily_metrics
+
+        mock_order_repository.get_daily_metrics.side_effect = slow_daily_metrics
+        mock_order_repository.get_revenue_summary.return_value = (
+            Decimal("400.00"),
+            8,
+            Decimal("50.00"),
+        )
+
+        # Act
+        load = asyncio.create_task(
+            analytics_service_with_mock_repo.get_daily_analytics(sample_date_range)
+        )
+        await asyncio.sleep(0.005)
+        invalidate_analytics_cache()
+        await load
+        await analytics_service_with_mock_repo.get_daily_analytics(sample_date_range)
+
+        # Assert
+        assert mock_order_repository.get_daily_metrics.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_order_status_analytics_success(
         self,
@@ -150,7 +254,9 @@ class TestAnalyticsService:
         """Test successful order status analytics retrieval"""
         # Arrange
         mock_order_repository.get_order_status_metrics.return_value = (
-            sample_status_metrics
+            sample_status_metrics,
+            25,
+            Decimal("1250.00"),
         )
 
         # Act
@@ -169,6 +275,28 @@ class TestAnalyticsService:
             sample_date_range.start_date, sample_date_range.end_date
         )
 
+    @pytest.mark.asyncio
+    async def test_get_order_status_analytics_no_orders(
+        self, analytics_service_with_mock_repo, mock_order_repository, sample_date_range
+    ):
+        """Test status analytics for a period without orders totals to Decimal zero"""
+        # Arrange
+        mock_order_repository.get_order_status_metrics.return_value = (
+            [],
+            0,
+            Decimal("0.00"),
+        )
+
+        # Act
+        result = await analytics_service_with_mock_repo.get_order_status_analytics(
+            sample_date_range
+        )
+
+        # Assert
+        assert result.total_orders == 0
+        assert isinstance(result.total_revenue, Decimal)
+        assert result.total_revenue == Decimal("0.00")
+
     @pytest.mark.asyncio
     async def test_get_top_customers_success(
         self,
@@ -207,29 +335,24 @@ class TestAnalyticsService:
         analytics_service_with_mock_repo,
         mock_order_repository,
         sample_date_range,
-        sample_daily_metrics,
-        sample_status_metrics,
         sample_customer_metrics,
     ):
         """Test successful analytics summary retrieval"""
         # Arrange
-        mock_order_repository.get_daily_metrics.return_value = sample_daily_metrics
+        mock_order_repository.get_daily_status_rollup.return_value = [
+            (date(2026, 1, 1), "pending", "USD", 3, Decimal("150.00")),
+            (date(2026, 1, 1), "confirmed", "USD", 2, Decimal("100.00")),
+            (date(2026, 1, 2), "pending", "USD", 2, Decimal("100.00")),
+            (date(2026, 1, 2), "cancelled", "USD", 1, Decimal("50.00")),
+        ]
         mock_order_repository.get_revenue_summary.return_value = (
-            Decimal("400.00"),
-            8,
-            Decimal("50.00"),
-        )
-        mock_order_repository.get_order_status_metrics.return_value = (
-            sample_status_metrics
+            Decimal("320.00"),
+            6,
+            Decimal("53.33"),
         )
         mock_order_repository.get_customer_metrics.return_value = (
             sample_customer_metrics
         )
-        mock_order_repository.get_busiest_day.return_value = (date(2026, 1, 1), 5)
-        mock_order_repository.get_highest_revenue_day.return_value = (
-            date(2026, 1, 1),
-            Decimal("250.00"),
-        )
 
         # Act
         result = await analytics_service_with_mock_repo.get_analytics_summary(
@@ -240,11 +363,25 @@ class TestAnalyticsService:
         assert result is not None
         assert result.period == sample_date_range
         assert result.revenue_metrics.total_revenue == Decimal("400.00")
+        assert result.revenue_metrics.total_orders == 8
+        assert result.revenue_metrics.average_order_value == Decimal("50.00")
         assert len(result.status_breakdown) == 3
+        assert result.status_breakdown[0].status == "pending"
+        assert result.status_breakdown[0].count == 5
+        assert result.status_breakdown[0].percentage == 62.5
         assert len(result.daily_trend) == 31  # Full month
+        assert result.daily_trend[0].order_count == 5
+        assert result.daily_trend[0].total_revenue == Decimal("250.00")
         assert len(result.top_customers) == 2
         assert result.busiest_day == date(2026, 1, 1)
         assert result.highest_revenue_day == date(2026, 1, 1)
+        assert result.growth_rate == 25.0
+
+        # Only the previous period needs a separate revenue query
+        mock_order_repository.get_daily_status_rollup.assert_called_once()
+        mock_order_repository.get_revenue_summary.assert_called_once_with(
+            date(2025, 12, 1), date(2025, 12, 31)
+        )
 
     @pytest.mark.asyncio
     async def test_get_revenue_trends_success(
@@ -278,6 +415,35 @@ class TestAnalyticsService:
             expected_start, expected_end
         )
 
+    @pytest.mark.asyncio
+    async def test_stream_revenue_trends_covers_every_day(
+        self, analytics_service_with_mock_repo, mock_order_repository
+    ):
+        """Test streamed revenue trends cover the full range in order"""
+        # Arrange
+        days = 30
+        mock_order_repository.get_daily_metrics.return_value = []
+
+        # Act
+        result = [
+            metric
+            async for metric in analytics_service_with_mock_repo.stream_revenue_trends(
+                days
+            )
+        ]
+
+        # Assert
+        expected_end = date.today()
+        expected_start = expected_end - timedelta(days=days - 1)
+        assert len(result) == days
+        assert result[0].date == expected_start
+        assert result[-1].date == expected_end
+        assert all(
+            later.date - earlier.date == timedelta(days=1)
+            for earlier, later in zip(result, result[1:])
+        )
+        assert mock_order_repository.get_daily_metrics.call_count > 1
+
     @pytest.mark.asyncio
     async def test_get_customer_analytics_existing_customer(
         self,
@@ -288,8 +454,8 @@ class TestAnalyticsService:
         """Test getting analytics for an existing customer"""
         # Arrange
         customer_id = "cust_1"
-        mock_order_repository.get_customer_metrics.return_value = (
-            sample_customer_metrics
+        mock_order_repository.get_metrics_for_customer.return_value = (
+            sample_customer_metrics[0]
         )
 
         # Act
@@ -311,7 +477,7 @@ class TestAnalyticsService:
         """Test getting analytics for a non-existent customer"""
         # Arrange
         customer_id = "nonexistent_customer"
-        mock_order_repository.get_customer_metrics.return_value = []
+        mock_order_repository.get_metrics_for_customer.return_value = None
 
         # Act
         result = await analytics_service_with_mock_repo.get_customer_analytics(
@@ -366,54 +532,36 @@ class TestAnalyticsService:
         assert result[4].order_count == 0  # Filled zero
 
     @pytest.mark.asyncio
-    async def test_calculate_growth_rate_with_previous_data(
+    async def test_previous_period_revenue(
         self, analytics_service_with_mock_repo, mock_order_repository
     ):
-        """Test growth rate calculation with previous period data"""
+        """Test that growth compares against the equally long previous period"""
         # Arrange
         current_period = AnalyticsDateRange(
             start_date=date(2026, 1, 15), end_date=date(2026, 1, 21)  # 7 days
         )
-
-        # Mock current period revenue: $1000
-        # Mock previous period revenue: $800
-        # Expected growth rate: 25%
-        mock_order_repository.get_revenue_summary.side_effect = [
-            (Decimal("1000.00"), 10, Decimal("100.00")),  # Current period
-            (Decimal("800.00"), 8, Decimal("100.00")),  # Previous period
-        ]
+        mock_order_repository.get_revenue_summary.return_value = (
+            Decimal("800.00"),
+            4,
+            Decimal("200.00"),
+        )
 
         # Act
-        result = await analytics_service_with_mock_repo._calculate_growth_rate(
+        result = await analytics_service_with_mock_repo._previous_period_revenue(
             current_period
         )
 
         # Assert
-        assert result == 25.0
-        assert mock_order_repository.get_revenue_summary.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_calculate_growth_rate_with_zero_previous_revenue(
-        self, analytics_service_with_mock_repo, mock_order_repository
-    ):
-        """Test growth rate calculation when previous period has zero revenue"""
-        # Arrange
-        current_period = AnalyticsDateRange(
-            start_date=date(2026, 1, 15), end_date=date(2026, 1, 21)
-        )
-
-        mock_order_repository.get_revenue_summary.side_effect = [
-            (Decimal("1000.00"), 10, Decimal("100.00")),  # Current period
-            (Decimal("0.00"), 0, Decimal("0.00")),  # Previous period (zero)
-        ]
-
-        # Act
-        result = await analytics_service_with_mock_repo._calculate_growth_rate(
-            current_period
+        assert result == Decimal("800.00")
+        mock_order_repository.get_revenue_summary.assert_called_once_with(
+            date(2026, 1, 8), date(2026, 1, 14)
         )
 
-        # Assert
-        assert result is None  # Should return None when previous revenue is zero
+    def test_growth_rate_with_zero_previous_revenue(self):
+        """Test growth rate calculation when previous period has zero revenue"""
+        # Act & Assert
+        assert _growth_rate(Decimal("1000.00"), Decimal("800.00")) == 25.0
+        assert _growth_rate(Decimal("1000.00"), Decimal("0.00")) is None
 
     @pytest.mark.asyncio
     async def test_analytics_service_error_handling(
@@ -1,5 +1,6 @@
 """Unit tests for OrderService"""
 
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
@@ -7,7 +8,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.models.base import OrderStatus, PaymentStatus
-from app.models.order import Order
+from app.models.order import Address, Order, OrderItem, PaymentInfo
 from app.schemas.order import (
     AddressSchema,
     OrderCreate,
@@ -15,6 +16,7 @@ from app.schemas.order import (
     OrderUpdate,
     PaymentInfoCreate,
 )
+from app.services.analytics_service import analytics_cache
 from app.services.order_service import OrderService
 
 
@@ -56,14 +58,22 @@ class TestOrderService:
             customer_email="test@example.com",
             partition_key="cust_123",
             status=OrderStatus.PENDING,
-            items=order_data.items,
+            items=[
+                OrderItem(
+                    product_id="prod_1",
+                    product_name="Test Product",
+                    quantity=2,
+                    unit_price=Decimal("25.00"),
+                    total_price=Decimal("50.00"),
+                )
+            ],
             subtotal=Decimal("50.00"),
             tax_amount=Decimal("5.00"),
             shipping_amount=Decimal("10.00"),
             discount_amount=Decimal("0.00"),
             total_amount=Decimal("65.00"),
-            billing_address=order_data.billing_address,
-            payment_info=order_data.payment_info,
+            billing_address=Address(**order_data.billing_address.model_dump()),
+            payment_info=PaymentInfo(**order_data.payment_info.model_dump()),
             created_at=datetime.utcnow(),
         )
 
@@ -80,6 +90,55 @@ class TestOrderService:
         assert result.total_amount == Decimal("65.00")
         mock_order_repository.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_order_releases_inventory_when_payment_fails(
+        self, order_service_with_mock_repo, sample_order
+    ):
+        """Test that a failed payment authorization releases reserved stock"""
+        service = order_service_with_mock_repo
+        with patch.object(
+            service,
+            "_authorize_payment",
+            AsyncMock(side_effect=RuntimeError("declined")),
+        ), patch.object(service, "_release_inventory", AsyncMock()) as release:
+            # Act
+            await service._process_order_async(sample_order)
+
+        # Assert
+        release.assert_awaited_once_with(sample_order)
+
+    @pytest.mark.asyncio
+    async def test_process_order_respects_side_effect_limit(
+        self, order_service_with_mock_repo, sample_order
+    ):
+        """Test that side effects never exceed the shared concurrency limit"""
+        service = order_service_with_mock_repo
+        running = 0
+        peak = 0
+
+        async def step(order):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        with patch(
+            "app.services.order_service._side_effect_slots", asyncio.Semaphore(1)
+        ), patch.object(service, "_reserve_inventory", step), patch.object(
+            service, "_authorize_payment", step
+        ), patch.object(
+            service, "_send_order_confirmation", step
+        ):
+            # Act
+            await asyncio.gather(
+                service._process_order_async(sample_order),
+                service._process_order_async(sample_order),
+            )
+
+        # Assert
+        assert peak == 1
+
     @pytest.mark.asyncio
     async def test_get_order_success(
         self, order_service_with_mock_repo, mock_order_repository, sample_order
@@ -121,11 +180,12 @@ class TestOrderService:
         """Test updating order status"""
         # Arrange
         mock_order_repository.get_by_id.return_value = sample_order
-        updated_order = sample_order.copy()
+        updated_order = sample_order.model_copy()
         updated_order.status = OrderStatus.CONFIRMED
         mock_order_repository.update.return_value = updated_order
 
         update_data = OrderUpdate(status=OrderStatus.CONFIRMED)
+        analytics_cache.set("cached-range", object(), ttl=60)
 
         # Act
         result = await order_service_with_mock_repo.update_order(
@@ -135,6 +195,7 @@ class TestOrderService:
         # Assert
         assert result is not None
         assert result.status == OrderStatus.CONFIRMED
+        assert len(analytics_cache) == 0
         mock_order_repository.get_by_id.assert_called_once()
         mock_order_repository.update.assert_called_once()
 
@@ -145,7 +206,7 @@ class TestOrderService:
         """Test successful order cancellation"""
         # Arrange
         mock_order_repository.get_by_id.return_value = sample_order
-        cancelled_order = sample_order.copy()
+        cancelled_order = sample_order.model_copy()
         cancelled_order.status = OrderStatus.CANCELLED
         mock_order_repository.update.return_value = cancelled_order
 
@@ -175,26 +236,181 @@ class TestOrderService:
 
     @pytest.mark.asyncio
     async def test_list_orders_with_pagination(
-        self, order_service_with_mock_repo, mock_order_repository, sample_order
+        self, order_service_with_mock_repo, mock_order_repository, sample_order_summary
     ):
-        """Test listing orders with pagination"""
+        """Test listing order headers with pagination"""
         # Arrange
-        orders = [sample_order]
-        mock_order_repository.list_items.return_value = orders
-        mock_order_repository.count_orders.return_value = 1
+        orders = [sample_order_summary]
+        mock_order_repository.list_items_summary.return_value = orders
+        mock_order_repository.count_orders.return_value = 21
 
         # Act
-        result_orders, total_count = await order_service_with_mock_repo.list_orders(
-            customer_id="cust_456", page=1, page_size=20
+        (
+            result_orders,
+            total_count,
+            continuation_token,
+        ) = await order_service_with_mock_repo.list_orders(
+            customer_id="cust_456", page=2, page_size=20
         )
 
         # Assert
         assert len(result_orders) == 1
-        assert total_count == 1
+        assert total_count == 21
+        assert continuation_token is None
         assert result_orders[0].id == "order_123"
-        mock_order_repository.list_items.assert_called_once()
+        mock_order_repository.list_items_summary.assert_called_once_with(
+            "cust_456", 20, 20
+        )
         mock_order_repository.count_orders.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_orders_with_continuation_token(
+        self, order_service_with_mock_repo, mock_order_repository, sample_order_summary
+    ):
+        """Test that the first page and token-resumed pages use seek pagination"""
+        # Arrange
+        mock_order_repository.list_items_summary_page.side_effect = [
+            ([sample_order_summary], "token-2"),
+            ([sample_order_summary], None),
+        ]
+        mock_order_repository.count_orders.return_value = 2
+
+        # Act
+        _, _, first_token = await order_service_with_mock_repo.list_orders(
+            customer_id="cust_456", page=1, page_size=1
+        )
+        _, _, second_token = await order_service_with_mock_repo.list_orders(
+            customer_id="cust_456", page_size=1, continuation_token=first_token
+        )
+
+        # Assert
+        assert first_token == "token-2"
+        assert second_token is None
+        mock_order_repository.list_items_summary_page.assert_called_with(
+            "cust_456", 1, "token-2"
+        )
+        mock_order_repository.list_items_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_orders_across_customers_uses_offset_paging(
+        self, order_service_with_mock_repo, mock_order_repository, sample_order_summary
+    ):
+        """Test that unscoped listings never return a cross-partition token"""
+        # Arrange
+        mock_order_repository.list_items_summary.return_value = [sample_order_summary]
+        mock_order_repository.count_orders.return_value = 1
+
+        # Act
+        orders, _, continuation_token = await order_service_with_mock_repo.list_orders(
+            page=1, page_size=20, continuation_token="token-2"
+        )
+
+        # Assert
+        assert orders == [sample_order_summary]
+        assert continuation_token is None
+        mock_order_repository.list_items_summary.assert_called_once_with(None, 20, 0)
+        mock_order_repository.list_items_summary_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_orders_by_status(
+        self, order_service_with_mock_repo, mock_order_repository, sample_order_summary
+    ):
+        """Test that a status filter lists one page of headers for that status"""
+        # Arrange
+        mock_order_repository.get_orders_by_status_summary.return_value = [
+            sample_order_summary
+        ]
+        mock_order_repository.count_orders.return_value = 21
+
+        # Act
+        orders, _, continuation_token = await order_service_with_mock_repo.list_orders(
+            customer_id="cust_456", status=OrderStatus.PENDING, page=2, page_size=20
+        )
+
+        # Assert
+        assert orders == [sample_order_summary]
+        assert continuation_token is None
+        mock_order_repository.get_orders_by_status_summary.assert_called_once_with(
+            OrderStatus.PENDING, "cust_456", 20, 20
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_orders_reuses_recent_count(
+        self, order_service_with_mock_repo, mock_order_repository, sample_order_summary
+    ):
+        """Test that paging through a listing counts orders only once"""
+        # Arrange
+        mock_order_repository.list_items_summary_page.return_value = (
+            [sample_order_summary],
+            "t",
+        )
+        mock_order_repository.list_items_summary.return_value = [sample_order_summary]
+        mock_order_repository.count_orders.return_value = 21
+
+        # Act
+        await order_service_with_mock_repo.list_orders(
+            customer_id="cust_456", page=1, page_size=20
+        )
+        _, total_count, _ = await order_service_with_mock_repo.list_orders(
+            customer_id="cust_456", page=2, page_size=20
+        )
+
+        # Assert
+        assert total_count == 21
+        mock_order_repository.list_items_summary_page.assert_called_once()
+        mock_order_repository.list_items_summary.assert_called_once()
+        mock_order_repository.count_orders.assert_called_once_with("cust_456", None)
+
+    @pytest.mark.asyncio
+    async def test_list_orders_counts_per_status_until_created(
+        self,
+        order_service_with_mock_repo,
+        mock_order_repository,
+        sample_order,
+        sample_order_summary,
+    ):
+        """Test that totals follow the status filter and drop after a create"""
+        # Arrange
+        service = order_service_with_mock_repo
+        mock_order_repository.get_orders_by_status_summary.return_value = [
+            sample_order_summary
+        ]
+        mock_order_repository.count_orders.return_value = 3
+        mock_order_repository.create.return_value = sample_order
+
+        # Act
+        await service.list_orders(customer_id="cust_456", status=OrderStatus.PENDING)
+        await service.list_orders(customer_id="cust_456", status=OrderStatus.PENDING)
+        with patch.object(service, "_process_order_async", AsyncMock()):
+            await service.create_order(
+                OrderCreate(
+                    customer_id="cust_456",
+                    customer_email="test@example.com",
+                    items=[
+                        OrderItemCreate(
+                            product_id="prod_1",
+                            product_name="Test Product",
+                            quantity=1,
+                            unit_price=Decimal("25.00"),
+                        )
+                    ],
+                    billing_address=AddressSchema(
+                        street="123 Test St",
+                        city="Test City",
+                        state="TS",
+                        postal_code="12345",
+                    ),
+                    payment_info=PaymentInfoCreate(method="credit_card"),
+                )
+            )
+        await service.list_orders(customer_id="cust_456", status=OrderStatus.PENDING)
+
+        # Assert
+        assert mock_order_repository.count_orders.call_count == 2
+        mock_order_repository.count_orders.assert_called_with(
+            "cust_456", OrderStatus.PENDING
+        )
+
     @pytest.mark.asyncio
     async def test_delete_order_success(
         self, order_service_with_mock_repo, mock_order_repository
@@ -241,6 +457,20 @@ class TestOrderService:
         assert order_number.startswith("ORD-")
         assert len(order_number) == 21  # ORD- + YYYYMMDD + - + 8 chars
 
+    def test_generate_order_number_follows_date(self, order_service_with_mock_repo):
+        """Test that the cached date prefix changes with the day"""
+        # Act
+        first = order_service_with_mock_repo._generate_order_number(
+            datetime(2026, 1, 21, 23, 59)
+        )
+        second = order_service_with_mock_repo._generate_order_number(
+            datetime(2026, 1, 22, 0, 1)
+        )
+
+        # Assert
+        assert first.startswith("ORD-20260121-")
+        assert second.startswith("ORD-20260122-")
+
     def test_calculate_order_totals(
         self, order_service_with_mock_repo, sample_order_items
     ):